@@ -56,6 +56,8 @@ import queue
 import platform
 import logging
 from logging.handlers import RotatingFileHandler
+from collections import namedtuple
+from functools import lru_cache, partial
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
@@ -71,6 +73,13 @@ try:
 except ImportError:
     RECYCLE_BIN_AVAILABLE = False
 
+# Optional: vectorized numeric bucketing in the Pattern Scanner
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # ==============================
 # VERSION & CONSTANTS
 # ==============================
@@ -195,12 +204,38 @@ CONFIG = Config()
 # ==============================
 # OPERATION LOGGING SYSTEM
 # ==============================
+def read_last_lines(path: Path, count: int, block_size: int = 65536) -> List[str]:
+    """
+    Return the last `count` non-empty lines of a text file.
+
+    Reads backwards in blocks, so the cost depends on the size of those
+    lines rather than on how long the file has grown.
+    """
+    if count <= 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        # count + 1 newlines guarantees the first kept line is complete
+        while position > 0 and data.count(b'\n') <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    lines = data.split(b'\n')
+    if position > 0:
+        lines = lines[1:]  # Partial line cut by the block boundary
+    return [line.decode('utf-8').rstrip('\r') for line in lines if line.strip()][-count:]
+
 class OperationLogger:
     """Logs all file operations for undo functionality"""
 
     def __init__(self):
         self.current_operation = None
         self.operations = []
+        # limit -> (log file (mtime_ns, size), operations); see get_recent_operations
+        self._recent_cache = {}
 
     def start_operation(self, operation_type: str, source_dirs: List[str], target_dir: str):
         """Start a new operation"""
@@ -265,17 +300,26 @@ class OperationLogger:
             self.current_operation = None
 
     def get_recent_operations(self, limit: int = 10) -> List[dict]:
-        """Get recent operations from log file"""
+        """Get recent operations from log file (cached until the file changes)"""
+        try:
+            st = os.stat(DATA_DIR.operations_file)
+        except OSError:
+            return []
+        file_token = (st.st_mtime_ns, st.st_size)
+
+        cached = self._recent_cache.get(limit)
+        if cached and cached[0] == file_token:
+            return list(cached[1])
+
         operations = []
-        if DATA_DIR.operations_file.exists():
-            try:
-                with open(DATA_DIR.operations_file, 'r') as f:
-                    lines = f.readlines()
-                    for line in lines[-limit:]:
-                        operations.append(json.loads(line))
-            except Exception as e:
-                print(f"Failed to read operations: {e}")
-        return operations
+        try:
+            for line in read_last_lines(DATA_DIR.operations_file, limit):
+                operations.append(json.loads(line))
+        except Exception as e:
+            print(f"Failed to read operations: {e}")
+            return operations
+        self._recent_cache[limit] = (file_token, operations)
+        return list(operations)
 
     def undo_last_operation(self) -> Tuple[bool, str]:
         """Undo the last operation"""
@@ -773,6 +817,7 @@ style.configure("TLabel", padding=2)
 style.configure("Title.TLabel", font=FONT_TITLE)
 style.configure("TProgressbar", thickness=12)
 style.configure("Section.TLabelframe.Label", font=FONT_TITLE)
+style.configure("History.Treeview", rowheight=22)  # Fixed row height for the undo history
 
 levels_entry = None
 
@@ -1371,9 +1416,19 @@ def detect_sequential_pattern(filename: str) -> Optional[str]:
     # Remove duplicate markers like (2), (3)
     base = re.sub(r'\s*[\-_]?\(\d+\)$', '', base).rstrip(' .')
 
+    # The result never depends on the trailing digits themselves, only on
+    # what precedes them, so IMG_0001..IMG_9999 all share one cached lookup
+    m_digits = re.search(r'\d+$', base)
+    if not m_digits or m_digits.end() - m_digits.start() < 2:
+        return None
+    return _sequential_folder_for_stem(base[:m_digits.start()])
+
+@lru_cache(maxsize=131072)
+def _sequential_folder_for_stem(stem: str) -> Optional[str]:
+    """Folder name for a sequential-file stem (base name minus its trailing digits)"""
     # Pattern 1: BASE with separator followed by 2+ digits
     # Example: vacation-001, file_123, IMG-1234
-    m_sep = re.match(r'^(.+?)([-_])(\d{2,})$', base)
+    m_sep = re.fullmatch(r'(.+)[-_]', stem)
     if m_sep:
         base_name = m_sep.group(1)
         # Capitalize if all lowercase or mixed case, keep uppercase as-is
@@ -1384,19 +1439,14 @@ def detect_sequential_pattern(filename: str) -> Optional[str]:
     # Pattern 2: BASE without separator followed by 2+ digits
     # Example: file001, vacation123
     # Must be letters followed by digits, or mixed alphanumeric
-    m_no_sep = re.match(r'^([A-Za-z]+)(\d{2,})$', base)
-    if m_no_sep:
-        base_name = m_no_sep.group(1)
+    if re.fullmatch(r'[A-Za-z]+', stem):
         # Capitalize if all lowercase or mixed case, keep uppercase as-is
-        if base_name.isupper():
-            return sanitize_folder_name(base_name)
-        return sanitize_folder_name(base_name.capitalize())
+        if stem.isupper():
+            return sanitize_folder_name(stem)
+        return sanitize_folder_name(stem.capitalize())
 
-    # Pattern 3: Numeric BASE with separator followed by 2+ digits
-    # Example: 031204-0022, 20240101-001
-    m_numeric = re.match(r'^(\d+)([-_])(\d{2,})$', base)
-    if m_numeric:
-        return sanitize_folder_name(m_numeric.group(1))
+    # Pattern 3 (numeric BASE with separator, e.g. 031204-0022) is covered by
+    # Pattern 1: a digit stem followed by - or _ is returned unchanged
 
     return None
 
@@ -2034,8 +2084,8 @@ def run_organizer(folder_logic, preview=False, operation_name="Organize"):
 def monitor_operation_progress():
     """Monitor the operation queue and update GUI (called from main thread)"""
     try:
-        # Check queue for updates
-        while not operation_queue.empty():
+        # Drain pending updates; get_nowait() raises queue.Empty once caught up
+        while True:
             message = operation_queue.get_nowait()
 
             if message['type'] == 'progress':
@@ -2081,11 +2131,8 @@ def monitor_operation_progress():
                 messagebox.showerror("Error", f"Operation failed:\n\n{message['message']}")
                 return  # Stop monitoring
 
-        # Continue monitoring (check again in 100ms)
-        root.after(100, monitor_operation_progress)
-
     except queue.Empty:
-        # Queue is empty, keep monitoring
+        # Queue is drained, check again in 100ms
         root.after(100, monitor_operation_progress)
 
 # ==============================
@@ -2525,6 +2572,11 @@ def create_custom_hierarchy_gui():
 # ── MISSING FILE SCANNER (v7.1) ───────────────────────────────────────────────
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Filename shapes recognised by detect_file_patterns, tried in this order
+_PURE_NUMBER_RE = re.compile(r'^(\d+)$')                 # 001, 1, 0042
+_PREFIX_NUMBER_RE = re.compile(r'^(.+?)(\d+)$')          # IMG_001, photo_42
+_PREFIX_NUMBER_SUFFIX_RE = re.compile(r'^(.+?)(\d+)(.+)$')  # IMG_001_final
+
 def detect_file_patterns(directory: str) -> Dict[str, Dict]:
     """
     Detect numeric patterns in filenames and group files by pattern.
@@ -2539,7 +2591,6 @@ def detect_file_patterns(directory: str) -> Dict[str, Dict]:
             'is_pure_numeric': bool
         }
     """
-    import re
     from collections import defaultdict
 
     if not os.path.isdir(directory):
@@ -2554,55 +2605,56 @@ def detect_file_patterns(directory: str) -> Dict[str, Dict]:
         'is_pure_numeric': False
     })
 
-    files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
+    # scandir reports the file type from the directory read, so no stat per name
+    with os.scandir(directory) as it:
+        files = [entry.name for entry in it if entry.is_file()]
+
+    # A pattern needs at least 2 files; skip the matching work otherwise
+    if len(files) < 2:
+        return {}
 
     for filename in files:
-        name, ext = os.path.splitext(filename)
+        # Inline os.path.splitext: last dot, ignoring leading dots (".hidden")
+        dot = filename.rfind('.')
+        if dot > 0 and (filename[0] != '.' or filename[:dot].lstrip('.')):
+            name, ext = filename[:dot], filename[dot:]
+        else:
+            name, ext = filename, ''
 
         # Try to match numeric patterns
         # Pattern 1: Pure numeric (001, 1, 0042, etc.)
-        match = re.match(r'^(\d+)$', name)
+        match = _PURE_NUMBER_RE.match(name)
         if match:
-            number = int(match.group(1))
-            padding = len(match.group(1))
+            digits = match.group(1)
             pattern_key = f"PURE_NUMERIC_{ext}"
-            patterns[pattern_key]['files'].append((filename, number))
-            patterns[pattern_key]['prefix'] = ''
-            patterns[pattern_key]['suffix'] = ''
-            patterns[pattern_key]['padding'] = max(patterns[pattern_key]['padding'], padding)
-            patterns[pattern_key]['extension'] = ext
-            patterns[pattern_key]['is_pure_numeric'] = True
-            continue
-
-        # Pattern 2: Prefix + number (IMG_001, photo_42, etc.)
-        match = re.match(r'^(.+?)(\d+)$', name)
-        if match:
-            prefix = match.group(1)
-            number = int(match.group(2))
-            padding = len(match.group(2))
-            pattern_key = f"{prefix}_{ext}"
-            patterns[pattern_key]['files'].append((filename, number))
-            patterns[pattern_key]['prefix'] = prefix
-            patterns[pattern_key]['suffix'] = ''
-            patterns[pattern_key]['padding'] = max(patterns[pattern_key]['padding'], padding)
-            patterns[pattern_key]['extension'] = ext
-            patterns[pattern_key]['is_pure_numeric'] = False
-            continue
-
-        # Pattern 3: Prefix + number + suffix (IMG_001_final, etc.)
-        match = re.match(r'^(.+?)(\d+)(.+)$', name)
-        if match:
-            prefix = match.group(1)
-            number = int(match.group(2))
-            suffix = match.group(3)
-            padding = len(match.group(2))
-            pattern_key = f"{prefix}_NUM_{suffix}_{ext}"
-            patterns[pattern_key]['files'].append((filename, number))
-            patterns[pattern_key]['prefix'] = prefix
-            patterns[pattern_key]['suffix'] = suffix
-            patterns[pattern_key]['padding'] = max(patterns[pattern_key]['padding'], padding)
-            patterns[pattern_key]['extension'] = ext
-            patterns[pattern_key]['is_pure_numeric'] = False
+            prefix = suffix = ''
+            is_pure_numeric = True
+        else:
+            # Pattern 2: Prefix + number (IMG_001, photo_42, etc.)
+            match = _PREFIX_NUMBER_RE.match(name)
+            if match:
+                prefix, digits = match.groups()
+                pattern_key = f"{prefix}_{ext}"
+                suffix = ''
+            else:
+                # Pattern 3: Prefix + number + suffix (IMG_001_final, etc.)
+                match = _PREFIX_NUMBER_SUFFIX_RE.match(name)
+                if not match:
+                    continue
+                prefix, digits, suffix = match.groups()
+                pattern_key = f"{prefix}_NUM_{suffix}_{ext}"
+            is_pure_numeric = False
+
+        pattern = patterns[pattern_key]
+        pattern['files'].append((filename, int(digits)))
+        pattern['prefix'] = prefix
+        pattern['suffix'] = suffix
+        # Running max of the digit width, kept in the same pass
+        width = len(digits)
+        if width > pattern['padding']:
+            pattern['padding'] = width
+        pattern['extension'] = ext
+        pattern['is_pure_numeric'] = is_pure_numeric
 
     # Filter out patterns with less than 2 files
     return {k: v for k, v in patterns.items() if len(v['files']) >= 2}
@@ -2618,19 +2670,21 @@ def find_missing_files(pattern_data: Dict) -> List[int]:
     if not pattern_data['files']:
         return []
 
-    numbers = sorted([num for _, num in pattern_data['files']])
-    first_num = numbers[0]
-    last_num = numbers[-1]
+    numbers = sorted({num for _, num in pattern_data['files']})
 
     # For pure numeric files, start from 1
     if pattern_data['is_pure_numeric']:
-        start = 1
+        previous = 0
     else:
-        start = first_num
+        previous = numbers[0] - 1
 
-    # Find all missing numbers in range
-    existing_set = set(numbers)
-    missing = [n for n in range(start, last_num + 1) if n not in existing_set]
+    # Expand only the gaps between neighbouring numbers instead of
+    # testing every number in the range against the existing set
+    missing = []
+    for number in numbers:
+        if number > previous + 1:
+            missing.extend(range(previous + 1, number))
+        previous = max(previous, number)
 
     return missing
 
@@ -2643,17 +2697,23 @@ def create_placeholder_files(directory: str, pattern_data: Dict, missing_numbers
         (success, message, list of created filenames)
     """
     created_files = []
+    # One printf-style template for every name, e.g. "IMG_%03d_final.jpg"
+    name_template = (
+        pattern_data['prefix'].replace('%', '%%')
+        + f"%0{pattern_data['padding']}d"
+        + (pattern_data['suffix'] + pattern_data['extension']).replace('%', '%%')
+    )
+    dir_prefix = os.path.join(directory, '')
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
 
     try:
         for num in missing_numbers:
             # Build filename
-            num_str = str(num).zfill(pattern_data['padding'])
-            filename = f"{pattern_data['prefix']}{num_str}{pattern_data['suffix']}{pattern_data['extension']}"
-            filepath = os.path.join(directory, filename)
+            filename = name_template % num
 
-            # Create empty file
-            with open(filepath, 'w') as f:
-                pass  # Empty file
+            # Create empty file (raw open/close, no buffered file object);
+            # 0o666 leaves the permissions to the umask, as open() does
+            os.close(os.open(dir_prefix + filename, flags, 0o666))
 
             created_files.append(filename)
 
@@ -2719,6 +2779,10 @@ def detect_file_patterns_recursive(parent_dir: str, progress_callback: Optional[
                     'PURE_NUMERIC_.jpg': {...},
                     'IMG_': {...}
                 },
+                'missing': {
+                    'PURE_NUMERIC_.jpg': [3, 4, ...],
+                    'IMG_': [...]
+                },
                 'total_missing': 15,
                 'total_patterns': 2
             }
@@ -2758,10 +2822,13 @@ def detect_file_patterns_recursive(parent_dir: str, progress_callback: Optional[
             patterns = detect_file_patterns(dirpath)
 
             if patterns:
-                # Calculate total missing files across all patterns
+                # Calculate total missing files across all patterns; the gap
+                # lists are kept so placeholder creation doesn't recompute them
+                missing_by_pattern = {}
                 total_missing = 0
                 for pattern_key, pattern_data in patterns.items():
                     missing = find_missing_files(pattern_data)
+                    missing_by_pattern[pattern_key] = missing
                     total_missing += len(missing)
 
                 # Only include if there are missing files
@@ -2770,6 +2837,7 @@ def detect_file_patterns_recursive(parent_dir: str, progress_callback: Optional[
                         'folder_name': os.path.basename(dirpath),
                         'folder_path': dirpath,
                         'patterns': patterns,
+                        'missing': missing_by_pattern,
                         'total_missing': total_missing,
                         'total_patterns': len(patterns)
                     }
@@ -2781,13 +2849,16 @@ def detect_file_patterns_recursive(parent_dir: str, progress_callback: Optional[
     return results
 
 
-def create_placeholders_for_folder(dirpath: str, patterns_data: Dict) -> Tuple[int, int, List[str]]:
+def create_placeholders_for_folder(dirpath: str, patterns_data: Dict,
+                                   missing_by_pattern: Optional[Dict[str, List[int]]] = None) -> Tuple[int, int, List[str]]:
     """
     Create placeholder files for all patterns in a folder.
 
     Args:
         dirpath: Directory path
         patterns_data: Patterns data from detect_file_patterns
+        missing_by_pattern: Optional gap lists already computed by
+            detect_file_patterns_recursive, keyed like patterns_data
 
     Returns:
         (total_created, total_failed, error_messages)
@@ -2797,7 +2868,10 @@ def create_placeholders_for_folder(dirpath: str, patterns_data: Dict) -> Tuple[i
     error_messages = []
 
     for pattern_key, pattern_data in patterns_data.items():
-        missing = find_missing_files(pattern_data)
+        if missing_by_pattern is not None and pattern_key in missing_by_pattern:
+            missing = missing_by_pattern[pattern_key]
+        else:
+            missing = find_missing_files(pattern_data)
 
         if missing:
             success, message, created_files = create_placeholder_files(dirpath, pattern_data, missing)
@@ -3331,7 +3405,8 @@ def show_recursive_folder_selection(parent_dir: str, folder_results: Dict):
         for folder in selected_folders:
             created, failed, errors = create_placeholders_for_folder(
                 folder['dirpath'],
-                folder['data']['patterns']
+                folder['data']['patterns'],
+                folder['data'].get('missing')
             )
             total_created += created
             total_failed += failed
@@ -3886,14 +3961,58 @@ def by_intelligent(filename: str) -> Optional[str]:
 # ==============================
 # AUTOMATIC PATTERN SCANNER
 # ==============================
+# Maps '-' and '_' to spaces so str.split() tokenizes on [-_\s]+ without a regex
+_DELIMS_TO_SPACE = str.maketrans('-_', '  ')
+
+# Camera/device tags, compiled once instead of per file
+_CAMERA_TAG_RE = re.compile(r'\b(IMG|DSC|DSCN|DCS|DCSN|VID|MOV|PXL)\b')
+_CAMERA_TAG_RE_NOCASE = re.compile(_CAMERA_TAG_RE.pattern, re.IGNORECASE)
+
+class PatternGroup(namedtuple('PatternGroup', ['type', 'name', 'files'])):
+    """One detected pattern; `files` is the only mutable part"""
+    __slots__ = ()
+
+    @property
+    def folder_name(self) -> str:
+        """Destination folder, derived on demand so the scan loop never title-cases"""
+        if self.type in ('prefix', 'delimiter'):
+            return self.name.title()
+        if self.type == 'uncategorized':
+            return 'Uncategorized'
+        return self.name
+
 def analyze_filename_patterns(filenames, progress_callback=None):
     """
     Analyzes a list of filenames and detects common patterns.
     Returns a dictionary of detected patterns with file lists.
     Optimized for millions of files.
+
+    Keys are (type, name) tuples, e.g. ('prefix', 'Vacation'), so the hot
+    loop never builds throwaway "TYPE:name" strings per file. Values are
+    PatternGroup tuples, which are far lighter than a dict per pattern.
     """
     patterns = {}
+    # pattern_key -> bound files.append, so a repeat hit is one dict lookup
+    appenders = {}
     total = len(filenames)
+    numeric_digits = []
+    numeric_files = []
+    # Names no single-file check matched, for patterns 6/7 (two flat lists
+    # rather than a tuple per file, to keep large scans light)
+    leftover_files = []
+    leftover_bases = []
+    # The setting cannot change mid-scan, so resolve it once
+    case_sensitive = is_case_sensitive()
+    camera_re = _CAMERA_TAG_RE if case_sensitive else _CAMERA_TAG_RE_NOCASE
+
+    def append(ptype: str, name: str, filename: str):
+        """Add filename to the (ptype, name) group, creating the group on first use"""
+        pattern_key = (ptype, name)
+        add_file = appenders.get(pattern_key)
+        if add_file is None:
+            patterns[pattern_key] = PatternGroup(ptype, name, [])
+            add_file = appenders[pattern_key] = patterns[pattern_key].files.append
+        add_file(filename)
 
     for idx, filename in enumerate(filenames):
         if progress_callback and idx % 5000 == 0:
@@ -3905,15 +4024,7 @@ def analyze_filename_patterns(filenames, progress_callback=None):
         # Example: "031204-0022" → "031204", "file001" → "File", "vacation-001" → "Vacation"
         seq_folder = detect_sequential_pattern(filename)
         if seq_folder:
-            pattern_key = f"SEQUENCE:{seq_folder}"
-            if pattern_key not in patterns:
-                patterns[pattern_key] = {
-                    'type': 'sequence',
-                    'name': seq_folder,
-                    'files': [],
-                    'folder_name': seq_folder
-                }
-            patterns[pattern_key]['files'].append(filename)
+            append('sequence', seq_folder, filename)
             continue
 
         # Pattern 1: Common prefix (letters/words before numbers/delimiters)
@@ -3921,50 +4032,32 @@ def analyze_filename_patterns(filenames, progress_callback=None):
         m_prefix = re.match(r'^([A-Za-z]+[A-Za-z\s]*?)[-_\s]*\d', base)
         if m_prefix:
             prefix = m_prefix.group(1).strip()
-            pattern_key = f"PREFIX:{prefix}"
-            if pattern_key not in patterns:
-                patterns[pattern_key] = {
-                    'type': 'prefix',
-                    'name': prefix,
-                    'files': [],
-                    'folder_name': prefix.title()
-                }
-            patterns[pattern_key]['files'].append(filename)
+            append('prefix', prefix, filename)
             continue
 
         # Pattern 2: Delimiter-based tokens (extract middle token)
         # Example: "Project-Alpha-001" → "Project-Alpha"
-        tokens = re.split(r'[-_\s]+', base)
-        if len(tokens) >= 2:
-            # Remove trailing numeric tokens
-            non_numeric_tokens = [t for t in tokens if not t.isdigit()]
-            if len(non_numeric_tokens) >= 2:
-                pattern_name = '-'.join(non_numeric_tokens[:2])
-                pattern_key = f"DELIM:{pattern_name}"
-                if pattern_key not in patterns:
-                    patterns[pattern_key] = {
-                        'type': 'delimiter',
-                        'name': pattern_name,
-                        'files': [],
-                        'folder_name': pattern_name.title()
-                    }
-                patterns[pattern_key]['files'].append(filename)
-                continue
+        # Only the first two non-numeric tokens matter, so stop scanning there.
+        # str.isdigit() is a single C call per token; set- or translate-based
+        # digit checks measured several times slower.
+        first_token = second_token = None
+        for token in base.translate(_DELIMS_TO_SPACE).split():
+            if not token.isdigit():
+                if first_token is None:
+                    first_token = token
+                else:
+                    second_token = token
+                    break
+        if second_token is not None:
+            pattern_name = f"{first_token}-{second_token}"
+            append('delimiter', pattern_name, filename)
+            continue
 
         # Pattern 3: Camera/device tags (IMG, DSC, etc.)
-        flags = 0 if is_case_sensitive() else re.IGNORECASE
-        m_camera = re.search(r'\b(IMG|DSC|DSCN|DCS|DCSN|VID|MOV|PXL)\b', base, flags)
+        m_camera = camera_re.search(base)
         if m_camera:
-            tag = m_camera.group(1) if is_case_sensitive() else m_camera.group(1).upper()
-            pattern_key = f"CAMERA:{tag}"
-            if pattern_key not in patterns:
-                patterns[pattern_key] = {
-                    'type': 'camera',
-                    'name': tag,
-                    'files': [],
-                    'folder_name': tag
-                }
-            patterns[pattern_key]['files'].append(filename)
+            tag = m_camera.group(1) if case_sensitive else m_camera.group(1).upper()
+            append('camera', tag, filename)
             continue
 
         # Pattern 4: Date patterns (YYYY-MM-DD, YYYYMMDD, etc.)
@@ -3972,63 +4065,193 @@ def analyze_filename_patterns(filenames, progress_callback=None):
         if m_date:
             year, month, day = m_date.groups()
             date_str = f"{year}-{month}"
-            pattern_key = f"DATE:{date_str}"
-            if pattern_key not in patterns:
-                patterns[pattern_key] = {
-                    'type': 'date',
-                    'name': date_str,
-                    'files': [],
-                    'folder_name': date_str
-                }
-            patterns[pattern_key]['files'].append(filename)
+            append('date', date_str, filename)
             continue
 
         # Pattern 5: Pure numeric start (group by first digits)
+        # Bucketed in one batch after the loop
         m_numeric = re.match(r'^(\d+)', base)
         if m_numeric:
-            num = int(m_numeric.group(1))
-            # Group into ranges of 1000
-            bucket = (num // 1000) * 1000
-            pattern_key = f"NUMERIC:{bucket}"
-            if pattern_key not in patterns:
-                patterns[pattern_key] = {
-                    'type': 'numeric',
-                    'name': f"{bucket}-{bucket+999}",
-                    'files': [],
-                    'folder_name': f"{bucket}-{bucket+999}"
-                }
-            patterns[pattern_key]['files'].append(filename)
+            numeric_digits.append(m_numeric.group(1))
+            numeric_files.append(filename)
             continue
 
-        # Pattern 6: Extension grouping (fallback)
-        if ext:
-            ext_clean = ext[1:].upper()
-            pattern_key = f"EXT:{ext_clean}"
-            if pattern_key not in patterns:
-                patterns[pattern_key] = {
-                    'type': 'extension',
-                    'name': ext_clean,
-                    'files': [],
-                    'folder_name': ext_clean
-                }
-            patterns[pattern_key]['files'].append(filename)
+        # Patterns 6/7 need every leftover name at once; see below
+        leftover_files.append(filename)
+        leftover_bases.append(base)
+
+    # Pattern 6: Leading words shared by several leftovers
+    # Example: "VacationBeach.jpg", "VacationPool.jpg" → "Vacation"
+    leftover_prefixes = _find_common_prefixes(leftover_bases, case_sensitive)
+    for filename, base, prefix in zip(leftover_files, leftover_bases, leftover_prefixes):
+        if prefix:
+            append('prefix', prefix, filename)
+        # Pattern 7: Extension grouping (fallback)
+        elif len(base) < len(filename):
+            ext_clean = filename[len(base) + 1:].upper()
+            append('extension', ext_clean, filename)
         else:
             # No pattern detected - goes to "Uncategorized"
-            pattern_key = "UNCAT:Other"
-            if pattern_key not in patterns:
-                patterns[pattern_key] = {
-                    'type': 'uncategorized',
-                    'name': 'Other',
-                    'files': [],
-                    'folder_name': 'Uncategorized'
-                }
-            patterns[pattern_key]['files'].append(filename)
+            append('uncategorized', 'Other', filename)
+
+    if numeric_files:
+        _bucket_numeric_files(patterns, numeric_digits, numeric_files)
 
     if progress_callback:
         progress_callback(total, total)
 
     return patterns
 
+def _is_word_boundary(name: str, length: int) -> bool:
+    """True if name[:length] ends a word: at the end of the name, before a
+    non-alphanumeric character, or where a new CamelCase word starts"""
+    if length >= len(name):
+        return True
+    nxt = name[length]
+    if not nxt.isalnum():
+        return True
+    # "Vacation|Beach": lowercase, then a capital that begins a lowercase word
+    return (nxt.isupper() and name[length - 1].islower()
+            and (length + 1 == len(name) or name[length + 1].islower()))
+
+def _find_common_prefixes(bases: List[str], case_sensitive: bool,
+                          min_files: int = 3, min_length: int = 3) -> List[Optional[str]]:
+    """
+    Discover leading words shared by several names.
+
+    Returns, for each entry in bases, the common prefix of its group or None.
+    Sorting puts names with shared leading text next to each other, so a
+    group is a run of at least min_files neighbours whose shared text is at
+    least min_length characters and ends on a word boundary in every member
+    (see _is_word_boundary). "VacationBeach", "VacationPool" and
+    "VacationHotel" share "Vacation"; "contract"/"contacts" share no whole
+    word and stay ungrouped. Memory is O(n), with no per-character
+    structures.
+    """
+    # Compare case-folded keys, unless lowering changes a name's length
+    keys = bases if case_sensitive else [
+        lowered if len(lowered) == len(base) else base
+        for base, lowered in zip(bases, (base.lower() for base in bases))
+    ]
+    order = sorted(range(len(bases)), key=keys.__getitem__)
+    prefixes = [None] * len(bases)
+
+    def shared_word_length(i: int, j: int) -> int:
+        """Longest common prefix of names i and j ending on a word boundary in both"""
+        a, b = keys[i], keys[j]
+        length = 0
+        limit = min(len(a), len(b))
+        while length < limit and a[length] == b[length]:
+            length += 1
+        while length >= min_length:
+            if _is_word_boundary(bases[i], length) and _is_word_boundary(bases[j], length):
+                return length
+            length -= 1
+        return 0
+
+    def close_run(run: List[int], length: int):
+        if len(run) < min_files:
+            return
+        # Every member shares `length` characters; make sure it is a word end for all
+        while length >= min_length and not all(_is_word_boundary(bases[i], length) for i in run):
+            length -= 1
+        # Name each group after its first member's spelling
+        prefix = bases[min(run)][:length].rstrip(' .-_')
+        if len(prefix) >= min_length:
+            for i in run:
+                prefixes[i] = prefix
+
+    run = order[:1]
+    run_length = 0
+    for previous, current in zip(order, order[1:]):
+        length = shared_word_length(previous, current)
+        if length:
+            run_length = min(run_length, length) if len(run) > 1 else length
+            run.append(current)
+        else:
+            close_run(run, run_length)
+            run = [current]
+    close_run(run, run_length)
+    return prefixes
+
+def _bucket_numeric_files(patterns: Dict, digits: List[str], filenames: List[str]):
+    """
+    Add NUMERIC patterns grouping filenames into ranges of 1000 by leading number.
+
+    digits[i] is the leading digit run of filenames[i]. Uses NumPy when
+    available (and every number fits in int64); buckets are added in
+    ascending order either way.
+    """
+    buckets = {}
+    if NUMPY_AVAILABLE and max(map(len, digits)) <= 18:
+        nums = np.array(digits).astype(np.int64)
+        unique_buckets, inverse = np.unique((nums // 1000) * 1000, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        splits = np.cumsum(np.bincount(inverse))[:-1]
+        for bucket, indices in zip(unique_buckets.tolist(), np.split(order, splits)):
+            buckets[bucket] = [filenames[i] for i in indices.tolist()]
+    else:
+        for num_str, filename in zip(digits, filenames):
+            bucket = (int(num_str) // 1000) * 1000
+            if bucket not in buckets:
+                buckets[bucket] = []
+            buckets[bucket].append(filename)
+
+    for bucket in sorted(buckets):
+        bucket_range = f"{bucket}-{bucket+999}"
+        patterns[('numeric', bucket)] = PatternGroup('numeric', bucket_range, buckets[bucket])
+
+# Bump whenever analyze_filename_patterns groups names differently, so
+# caches written by an older scanner are not reused
+PATTERN_SCAN_CACHE_VERSION = 2
+
+def pattern_scan_signature(source_dirs: List[str], filenames: List[str]) -> str:
+    """
+    Fingerprint a Pattern Scanner input: the same signature means
+    analyze_filename_patterns would return the same result.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr((PATTERN_SCAN_CACHE_VERSION, source_dirs, is_case_sensitive(),
+                        len(filenames))).encode('utf-8'))
+    for filename in filenames:
+        digest.update(filename.encode('utf-8', 'surrogateescape'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def load_pattern_scan_cache(signature: str) -> Optional[Dict]:
+    """Return the cached scan result if it was saved for this signature, else None"""
+    cache_file = DATA_DIR.get_path("pattern_scan_cache.json")
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if not isinstance(cached, dict) or cached.get("signature") != signature:
+            return None
+        return {(ptype, key_name): PatternGroup(ptype, name, files)
+                for ptype, key_name, name, files in cached["patterns"]}
+    except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
+        APP_LOGGER.warning(f"Pattern scan cache corrupted, ignoring: {e}")
+        return None
+    except (IOError, OSError) as e:
+        APP_LOGGER.error(f"Cannot read pattern scan cache: {e}")
+        return None
+
+def save_pattern_scan_cache(signature: str, patterns: Dict):
+    """Persist the latest scan result so an unchanged rescan skips analysis"""
+    cache_file = DATA_DIR.get_path("pattern_scan_cache.json")
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            # ASCII escapes keep undecodable (surrogate-escaped) names writable
+            # and load them back unchanged
+            json.dump({
+                "signature": signature,
+                "patterns": [[ptype, key_name, group.name, group.files]
+                             for (ptype, key_name), group in patterns.items()]
+            }, f)
+    except (IOError, OSError, PermissionError, ValueError) as e:
+        APP_LOGGER.error(f"Failed to save pattern scan cache: {e}")
+
 def show_pattern_scanner():
     """Opens a window to scan and analyze filename patterns - optimized for millions of files"""
     scanner_win = tk.Toplevel(root)
@@ -4083,6 +4306,8 @@ def show_pattern_scanner():
     # Store detected patterns globally for organize function
     detected_patterns = {}
 
+    scan_queue = queue.Queue()
+
     def scan_files():
         source_dirs = get_source_dirs()
         if not source_dirs:
@@ -4096,52 +4321,95 @@ def show_pattern_scanner():
         detected_patterns.clear()
 
         progress_label.config(text="Scanning files...")
-        scanner_win.update()
+        scan_button.config(state="disabled")
 
-        # Collect all filenames
-        all_files = []
-        for source in source_dirs:
-            for dirpath, dirnames, files in os.walk(source):
-                # Filter skip folders
-                dirnames[:] = [d for d in dirnames if not should_skip_folder(d)]
-                for f in files:
-                    all_files.append((os.path.join(dirpath, f), f))
+        # Walk and analyze off the Tk thread; poll_scan() applies the updates
+        threading.Thread(target=scan_worker, args=(source_dirs,), daemon=True).start()
+        scanner_win.after(50, poll_scan)
 
-        total_files = len(all_files)
-        progress_label.config(text=f"Found {total_files:,} files. Analyzing patterns...")
-        scan_progress["maximum"] = total_files
-        scanner_win.update()
-
-        # Analyze patterns
-        filenames_only = [f for _, f in all_files]
-
-        def update_progress(current, total):
-            scan_progress["value"] = current
-            if current % 10000 == 0 or current == total:
-                progress_label.config(text=f"Analyzing... {current:,}/{total:,} files ({int(100*current/total)}%)")
-                scanner_win.update()
-
-        patterns = analyze_filename_patterns(filenames_only, update_progress)
+    def scan_worker(source_dirs):
+        """Collect and analyze filenames (runs in background thread)"""
+        try:
+            # Collect all filenames
+            filenames_only = []
+            for source in source_dirs:
+                for dirpath, dirnames, files in os.walk(source):
+                    # Filter skip folders
+                    dirnames[:] = [d for d in dirnames if not should_skip_folder(d)]
+                    filenames_only.extend(files)
+
+            scan_queue.put({'type': 'found', 'total': len(filenames_only)})
+
+            # Same files as the last scan: reuse its analysis
+            signature = pattern_scan_signature(source_dirs, filenames_only)
+            patterns = load_pattern_scan_cache(signature)
+            if patterns is None:
+                def report_progress(current, total):
+                    scan_queue.put({'type': 'progress', 'current': current, 'total': total})
+
+                patterns = analyze_filename_patterns(filenames_only, report_progress)
+                save_pattern_scan_cache(signature, patterns)
+            scan_queue.put({'type': 'complete', 'patterns': patterns, 'total': len(filenames_only)})
+        except Exception as e:
+            APP_LOGGER.error(f"Pattern scan failed: {e}")
+            scan_queue.put({'type': 'error', 'message': str(e)})
 
+    def poll_scan():
+        """Apply queued scan updates (called from main thread)"""
+        # Window closed mid-scan: stop polling, the results have nowhere to go
+        if not scanner_win.winfo_exists():
+            return
+        try:
+            while True:
+                message = scan_queue.get_nowait()
+
+                if message['type'] == 'found':
+                    total_files = message['total']
+                    progress_label.config(text=f"Found {total_files:,} files. Analyzing patterns...")
+                    scan_progress["maximum"] = total_files
+
+                elif message['type'] == 'progress':
+                    current, total = message['current'], message['total']
+                    scan_progress["value"] = current
+                    if total:
+                        progress_label.config(text=f"Analyzing... {current:,}/{total:,} files ({int(100*current/total)}%)")
+
+                elif message['type'] == 'complete':
+                    scan_button.config(state="normal")
+                    display_scan_results(message['patterns'], message['total'])
+                    return  # Stop polling
+
+                elif message['type'] == 'error':
+                    scan_button.config(state="normal")
+                    progress_label.config(text="Scan failed")
+                    messagebox.showerror("Error", f"Pattern scan failed:\n\n{message['message']}", parent=scanner_win)
+                    return  # Stop polling
+        except queue.Empty:
+            pass
+
+        # Worker still running, check again in 50ms
+        scanner_win.after(50, poll_scan)
+
+    def display_scan_results(patterns, total_files):
         # Filter patterns with minimum file count (at least 2 files)
         MIN_FILES = 2
-        filtered_patterns = {k: v for k, v in patterns.items() if len(v['files']) >= MIN_FILES}
+        filtered_patterns = {k: v for k, v in patterns.items() if len(v.files) >= MIN_FILES}
 
         # Sort by file count (descending)
-        sorted_patterns = sorted(filtered_patterns.items(), key=lambda x: len(x[1]['files']), reverse=True)
+        sorted_patterns = sorted(filtered_patterns.items(), key=lambda x: len(x[1].files), reverse=True)
 
         # Display results
         for pattern_key, pattern_data in sorted_patterns:
-            ptype = pattern_data['type'].title()
-            pname = pattern_data['name']
-            count = len(pattern_data['files'])
-            folder = pattern_data['folder_name']
+            ptype = pattern_data.type.title()
+            pname = pattern_data.name
+            count = len(pattern_data.files)
+            folder = pattern_data.folder_name
 
             # Get up to 3 sample filenames
-            samples = pattern_data['files'][:3]
+            samples = pattern_data.files[:3]
             sample_text = ", ".join(samples)
-            if len(pattern_data['files']) > 3:
-                sample_text += f" ... (+{len(pattern_data['files']) - 3} more)"
+            if count > 3:
+                sample_text += f" ... (+{count - 3} more)"
 
             tree.insert("", "end", values=(ptype, pname, f"{count:,}", folder, sample_text))
             detected_patterns[pattern_key] = pattern_data
@@ -4178,14 +4446,14 @@ def show_pattern_scanner():
 
         # Organize files based on detected patterns
         total_moved = 0
-        total_files = sum(len(p['files']) for p in detected_patterns.values())
+        total_files = sum(len(p.files) for p in detected_patterns.values())
         progress_bar["maximum"] = total_files
 
         for pattern_data in detected_patterns.values():
-            folder_name = pattern_data['folder_name']
+            folder_name = pattern_data.folder_name
             dst_folder = os.path.join(target_dir, folder_name)
 
-            for filename in pattern_data['files']:
+            for filename in pattern_data.files:
                 if filename in file_map:
                     src = file_map[filename]
                     if move_file(src, dst_folder, filename):
@@ -4204,7 +4472,8 @@ def show_pattern_scanner():
     button_frame = ttk.Frame(main_frame)
     button_frame.pack(fill="x")
 
-    ttk.Button(button_frame, text="🔍 Scan Files", command=scan_files, width=15).pack(side="left", padx=(0, 10))
+    scan_button = ttk.Button(button_frame, text="🔍 Scan Files", command=scan_files, width=15)
+    scan_button.pack(side="left", padx=(0, 10))
     ttk.Button(button_frame, text="📁 Organize by Patterns", command=organize_by_patterns, width=20).pack(side="left", padx=(0, 10))
     ttk.Button(button_frame, text="Close", command=scanner_win.destroy).pack(side="right")
 
@@ -4681,22 +4950,22 @@ def show_undo_window():
 
     # Treeview for operations
     columns = ("Timestamp", "Type", "Files Moved", "Duplicates", "Errors")
-    tree = ttk.Treeview(main_frame, columns=columns, show="headings", height=15)
+    tree = ttk.Treeview(main_frame, columns=columns, displaycolumns=columns, show="headings",
+                        height=15, style="History.Treeview")
 
+    # Fixed column widths so inserts don't trigger column re-measuring
     for col in columns:
         tree.heading(col, text=col)
-    tree.column("Timestamp", width=150)
-    tree.column("Type", width=150)
-    tree.column("Files Moved", width=100)
-    tree.column("Duplicates", width=100)
-    tree.column("Errors", width=80)
+    tree.column("Timestamp", width=150, stretch=False)
+    tree.column("Type", width=150, stretch=False)
+    tree.column("Files Moved", width=100, stretch=False)
+    tree.column("Duplicates", width=100, stretch=False)
+    tree.column("Errors", width=80, stretch=False)
 
     scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=tree.yview)
     tree.configure(yscrollcommand=scrollbar.set)
-    tree.pack(side="left", fill=tk.BOTH, expand=True)
-    scrollbar.pack(side="right", fill="y")
 
-    # Load operations
+    # Load operations before the tree is packed, so it is laid out once
     operations = LOGGER.get_recent_operations(20)
     for op in reversed(operations):
         tree.insert("", "end", values=(
@@ -4707,6 +4976,9 @@ def show_undo_window():
             op["stats"]["errors"]
         ))
 
+    tree.pack(side="left", fill=tk.BOTH, expand=True)
+    scrollbar.pack(side="right", fill="y")
+
     def do_undo():
         """Undo last operation with progress bar"""
         if not messagebox.askyesno("Confirm Undo", "Undo the last operation? This will move files back to their original locations."):
@@ -4727,57 +4999,43 @@ def show_undo_window():
         status_label = ttk.Label(progress_win, text="Preparing...")
         status_label.pack(pady=5)
 
-        # Perform undo in thread with progress updates
-        result_queue: queue.Queue = queue.Queue()
+        # UI updates run on the Tk thread: the worker posts them with after(0, ...)
+        def apply_progress(current, total, filename):
+            progress_bar["maximum"] = total
+            progress_bar["value"] = current
+            status_label.config(text=f"Restoring {current}/{total}: {filename[:50]}...")
 
-        def undo_worker():
-            """Worker thread for undo operation"""
-            try:
-                success, message, moved_count, total_count = LOGGER.undo_last_operation_with_progress(
-                    lambda current, total, filename: result_queue.put(('progress', current, total, filename))
-                )
-                result_queue.put(('complete', success, message, moved_count))
-            except Exception as e:
-                result_queue.put(('error', str(e)))
+        def apply_complete(message, moved_count):
+            progress_win.destroy()
+            messagebox.showinfo("Undo Result", f"{message}\n\n{moved_count} files restored.")
+            undo_win.destroy()
 
-        def monitor_undo():
-            """Monitor undo progress from main thread"""
-            try:
-                while not result_queue.empty():
-                    msg = result_queue.get_nowait()
-
-                    if msg[0] == 'progress':
-                        _, current, total, filename = msg
-                        progress_bar["maximum"] = total
-                        progress_bar["value"] = current
-                        status_label.config(text=f"Restoring {current}/{total}: {filename[:50]}...")
-
-                    elif msg[0] == 'complete':
-                        _, success, message, moved_count = msg
-                        progress_win.destroy()
-                        messagebox.showinfo("Undo Result", f"{message}\n\n{moved_count} files restored.")
-                        undo_win.destroy()
-                        return
+        def apply_error(error_msg):
+            progress_win.destroy()
+            messagebox.showerror("Undo Error", f"Failed to undo operation:\n\n{error_msg}")
 
-                    elif msg[0] == 'error':
-                        _, error_msg = msg
-                        progress_win.destroy()
-                        messagebox.showerror("Undo Error", f"Failed to undo operation:\n\n{error_msg}")
-                        return
+        # Cap UI updates at ~30/sec; large undos would otherwise flood the event loop
+        last_emit = 0.0
 
-                # Continue monitoring
-                progress_win.after(100, monitor_undo)
+        def report_progress(current, total, filename):
+            nonlocal last_emit
+            now = time.monotonic()
+            if now - last_emit >= 0.033 or current == total:
+                last_emit = now
+                progress_win.after(0, apply_progress, current, total, filename)
 
-            except queue.Empty:
-                progress_win.after(100, monitor_undo)
+        def undo_worker():
+            """Worker thread for undo operation"""
+            try:
+                success, message, moved_count, total_count = LOGGER.undo_last_operation_with_progress(report_progress)
+                progress_win.after(0, apply_complete, message, moved_count)
+            except Exception as e:
+                progress_win.after(0, apply_error, str(e))
 
         # Start undo thread
         undo_thread = threading.Thread(target=undo_worker, daemon=True)
         undo_thread.start()
 
-        # Start monitoring
-        monitor_undo()
-
     button_frame = ttk.Frame(main_frame)
     button_frame.pack(fill="x", pady=(10, 0))
     ttk.Button(button_frame, text="Undo Last Operation", command=do_undo).pack(side="left", padx=(0, 10))
@@ -4786,6 +5044,42 @@ def show_undo_window():
 # ==============================
 # STATISTICS WINDOW
 # ==============================
+def build_statistics_sections(operations: List[dict]) -> List[Tuple[str, str]]:
+    """Render the statistics report for operations (oldest first) as (heading, body) pairs"""
+    # Resolve each op's stats dict once; both the totals and the recent list reuse it
+    stats_list = [op["stats"] for op in operations]
+
+    # One pass over the history instead of a sum() per total
+    total_files = total_dupes = total_errors = 0
+    total_size_mb = 0
+    for stats in stats_list:
+        total_files += stats["files_moved"]
+        total_dupes += stats["duplicates_found"]
+        total_errors += stats["errors"]
+        total_size_mb += stats["total_size_mb"]
+
+    overall = (
+        f"Total Operations:        {len(operations)}\n"
+        f"Total Files Organized:   {total_files:,}\n"
+        f"Total Duplicates Found:  {total_dupes:,}\n"
+        f"Total Errors:            {total_errors:,}\n"
+        f"Total Data Moved:        {total_size_mb:,.2f} MB"
+    )
+
+    parts = []
+    for op, stats in zip(reversed(operations[-10:]), reversed(stats_list[-10:])):
+        parts.append(
+            f"{op['timestamp'][:19]} | {op['type']}\n"
+            f"  Files: {stats['files_moved']} | "
+            f"Dupes: {stats['duplicates_found']} | "
+            f"Errors: {stats['errors']}"
+        )
+
+    return [
+        ("📊 OVERALL STATISTICS", overall),
+        ("📈 RECENT OPERATIONS (Last 10)", "\n\n".join(parts)),
+    ]
+
 def show_statistics():
     """Show statistics from operation history"""
     stats_win = tk.Toplevel(root)
@@ -4797,66 +5091,72 @@ def show_statistics():
 
     ttk.Label(main_frame, text="Operation Statistics", font=FONT_TITLE).pack(anchor="w", pady=(0, 10))
 
-    operations = LOGGER.get_recent_operations(100)
+    # Static layout: labels separated by ttk.Separator instead of box-drawing text
+    report_frame = ttk.Frame(main_frame)
+    report_frame.pack(fill=tk.BOTH, expand=True)
+    report_frame.columnconfigure(0, weight=1)
+    report_frame.rowconfigure(0, weight=1)
+    content = create_scrollable_tab(report_frame)
 
-    if not operations:
-        ttk.Label(main_frame, text="No operations recorded yet.").pack()
-        return
+    status_label = ttk.Label(content, text="Loading statistics...", font=("Courier", 10))
+    status_label.pack(anchor="w")
 
-    # Calculate statistics
-    total_files = sum(op["stats"]["files_moved"] for op in operations)
-    total_dupes = sum(op["stats"]["duplicates_found"] for op in operations)
-    total_errors = sum(op["stats"]["errors"] for op in operations)
-    total_size_mb = sum(op["stats"]["total_size_mb"] for op in operations)
-
-    stats_text = tk.Text(main_frame, wrap="word", font=("Courier", 10), height=20)
-    stats_text.pack(fill=tk.BOTH, expand=True)
-
-    report = f"""
-╔═══════════════════════════════════════════╗
-║    FILE ORGANIZER STATISTICS              ║
-╚═══════════════════════════════════════════╝
-
-📊 OVERALL STATISTICS
-─────────────────────────────────────────────
-Total Operations:        {len(operations)}
-Total Files Organized:   {total_files:,}
-Total Duplicates Found:  {total_dupes:,}
-Total Errors:            {total_errors:,}
-Total Data Moved:        {total_size_mb:,.2f} MB
-
-📈 RECENT OPERATIONS (Last 10)
-─────────────────────────────────────────────
-"""
+    # Section heading -> [body label, text shown]; a refresh only touches changed sections
+    section_labels = {}
 
-    for op in reversed(operations[-10:]):
-        report += f"\n{op['timestamp'][:19]} | {op['type']}\n"
-        report += f"  Files: {op['stats']['files_moved']} | "
-        report += f"Dupes: {op['stats']['duplicates_found']} | "
-        report += f"Errors: {op['stats']['errors']}\n"
+    # Both run via stats_win.after from the worker, possibly after the window closed
+    def show_sections(sections):
+        if not stats_win.winfo_exists():
+            return
+        status_label.pack_forget()
+        for heading, body in sections:
+            entry = section_labels.get(heading)
+            if entry is None:
+                ttk.Label(content, text=heading, font=("Segoe UI", 10, "bold")).pack(anchor="w", pady=(0, 4))
+                ttk.Separator(content, orient="horizontal").pack(fill="x", pady=(0, 6))
+                body_label = ttk.Label(content, text=body, font=("Courier", 10), justify="left")
+                body_label.pack(anchor="w", pady=(0, 12))
+                section_labels[heading] = [body_label, body]
+            elif entry[1] != body:
+                entry[0].config(text=body)
+                entry[1] = body
+
+    def show_message(message):
+        if not stats_win.winfo_exists():
+            return
+        status_label.config(text=message)
+        status_label.pack(anchor="w")
 
-    stats_text.insert("1.0", report)
-    stats_text.config(state="disabled")
+    # Read and aggregate the history off the Tk thread; the window shows immediately
+    def compute_report():
+        try:
+            operations = LOGGER.get_recent_operations(100)
+            if not operations:
+                stats_win.after(0, show_message, "No operations recorded yet.")
+                return
+            sections = build_statistics_sections(operations)
+        except (KeyError, TypeError) as e:
+            APP_LOGGER.error(f"Failed to build statistics: {e}")
+            stats_win.after(0, show_message, f"Failed to build statistics: {e}")
+            return
+        stats_win.after(0, show_sections, sections)
 
-    ttk.Button(main_frame, text="Close", command=stats_win.destroy).pack(pady=(10, 0))
+    def refresh():
+        threading.Thread(target=compute_report, daemon=True).start()
+
+    button_frame = ttk.Frame(main_frame)
+    button_frame.pack(pady=(10, 0))
+    ttk.Button(button_frame, text="Refresh", command=refresh).pack(side="left", padx=(0, 6))
+    ttk.Button(button_frame, text="Close", command=stats_win.destroy).pack(side="left")
+
+    refresh()
 
 # ==============================
 # HELP WINDOW
 # ==============================
-def show_help():
-    help_win = tk.Toplevel(root)
-    help_win.title(f"Help — {VERSION} Guide")
-    help_win.geometry("800x700")
-    help_win.minsize(600, 500)
-    frame = tk.Frame(help_win)
-    frame.pack(fill=tk.BOTH, expand=True)
-    text_area = tk.Text(frame, wrap="word", font=("Segoe UI", 10))
-    scrollbar = tk.Scrollbar(frame, command=text_area.yview)
-    text_area.configure(yscrollcommand=scrollbar.set)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    text_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-    help_text = f"""
+# Built once at import; the help title and content only depend on VERSION
+HELP_TITLE = f"Help — {VERSION} Guide"
+HELP_TEXT = f"""
 FILE ORGANIZER — {VERSION}
 ═══════════════════════════════════════════════════
 
@@ -5030,8 +5330,23 @@ FILE ORGANIZER — {VERSION}
 ═══════════════════════════════════════════════════
 Version 6.2 — In-Place Organization
 """
-    text_area.insert(tk.END, help_text)
-    text_area.config(state=tk.DISABLED)
+
+def show_help():
+    help_win = tk.Toplevel(root)
+    help_win.title(HELP_TITLE)
+    help_win.geometry("800x700")
+    help_win.minsize(600, 500)
+    frame = ttk.Frame(help_win)
+    frame.pack(fill=tk.BOTH, expand=True)
+    frame.columnconfigure(0, weight=1)
+    frame.rowconfigure(0, weight=1)
+
+    # Static content: a single label in the same scroll frame the tabs use,
+    # laid out once instead of a Text widget's per-line tags and marks
+    content = create_scrollable_tab(frame)
+    help_label = ttk.Label(content, text=HELP_TEXT, justify="left", font=("Segoe UI", 10))
+    help_label.pack(fill="both", expand=True, padx=8, pady=8)
+    help_label.bind("<Configure>", lambda e: help_label.configure(wraplength=max(e.width - 4, 100)))
 
 # ==============================
 # BUTTON DEFINITIONS
@@ -5041,55 +5356,60 @@ def add_section(parent: ttk.Frame, title: str, buttons: list):
     sect.pack(fill="x", padx=0, pady=(0, 6))
     row = ttk.Frame(sect)
     row.pack(fill="x", padx=6, pady=6)
-    for label, cmd in buttons:
-        ttk.Button(row, text=label, command=cmd).pack(side="left", padx=(0, 6))
+    widgets = []
+    for label, fn, kwargs in buttons:
+        # Organizer modes are bound once to run_organizer; other entries are plain commands
+        cmd = fn if kwargs is None else partial(run_organizer, fn, **kwargs)
+        widgets.append(ttk.Button(row, text=label, command=cmd))
+    # One pack command for the whole row instead of one per button
+    row.tk.call("pack", *[str(w) for w in widgets], "-side", "left", "-padx", (0, 6))
     ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=0, pady=(0, 6))
 
 sections = {
     "By Extension": [
-        ("By Extension", lambda: run_organizer(by_extension, operation_name="By Extension")),
-        ("Preview", lambda: run_organizer(by_extension, preview=True)),
+        ("By Extension", by_extension, {"operation_name": "By Extension"}),
+        ("Preview", by_extension, {"preview": True}),
     ],
     "Alphabetize": [
-        ("Alphabetize", lambda: run_organizer(by_alphabet, operation_name="Alphabetize")),
-        ("Preview", lambda: run_organizer(by_alphabet, preview=True)),
-        ("Numeric", lambda: run_organizer(by_numeric_simple, operation_name="Numeric")),
+        ("Alphabetize", by_alphabet, {"operation_name": "Alphabetize"}),
+        ("Preview", by_alphabet, {"preview": True}),
+        ("Numeric", by_numeric_simple, {"operation_name": "Numeric"}),
     ],
     "IMG/DSC": [
-        ("IMG/DSC Only", lambda: run_organizer(by_img_dsc, operation_name="IMG/DSC")),
-        ("Preview", lambda: run_organizer(by_img_dsc, preview=True)),
+        ("IMG/DSC Only", by_img_dsc, {"operation_name": "IMG/DSC"}),
+        ("Preview", by_img_dsc, {"preview": True}),
     ],
     "📅 By Date": [
-        ("By Year (YYYY)", lambda: run_organizer(by_date_year, operation_name="By Year")),
-        ("By Month (YYYY-MM)", lambda: run_organizer(by_date_month, operation_name="By Month")),
-        ("By Day (YYYY-MM-DD)", lambda: run_organizer(by_date_full, operation_name="By Date")),
-        ("Preview", lambda: run_organizer(by_date_year, preview=True)),
+        ("By Year (YYYY)", by_date_year, {"operation_name": "By Year"}),
+        ("By Month (YYYY-MM)", by_date_month, {"operation_name": "By Month"}),
+        ("By Day (YYYY-MM-DD)", by_date_full, {"operation_name": "By Date"}),
+        ("Preview", by_date_year, {"preview": True}),
     ],
     "🧠 Intelligent Scanner": [
-        ("🧠 Organize with AI Learning", lambda: run_organizer(by_intelligent, operation_name="Intelligent Pattern")),
-        ("👁️ Preview Patterns", lambda: run_organizer(by_intelligent, preview=True)),
-        ("📚 View Learned Patterns", lambda: show_learned_patterns()),
-        ("🔬 Pattern Statistics", lambda: show_pattern_statistics()),
+        ("🧠 Organize with AI Learning", by_intelligent, {"operation_name": "Intelligent Pattern"}),
+        ("👁️ Preview Patterns", by_intelligent, {"preview": True}),
+        ("📚 View Learned Patterns", show_learned_patterns, None),
+        ("🔬 Pattern Statistics", show_pattern_statistics, None),
     ],
     "📤 Extract": [
-        ("Extract All to Parent", extract_all_to_parent),
-        ("Extract Up N Levels", extract_up_levels),
+        ("Extract All to Parent", extract_all_to_parent, None),
+        ("Extract Up N Levels", extract_up_levels, None),
     ],
     "📁 Folder Tools": [
-        ("Create A-Z + 0-9 Folders", create_alphanumeric_folders),
-        ("Create Custom Hierarchy", create_custom_hierarchy_gui),
-        ("🔍 Scan for Missing Files", scan_missing_files_gui),
+        ("Create A-Z + 0-9 Folders", create_alphanumeric_folders, None),
+        ("Create Custom Hierarchy", create_custom_hierarchy_gui, None),
+        ("🔍 Scan for Missing Files", scan_missing_files_gui, None),
     ],
     "🔍 Pattern Search": [
-        ("Search & Collect by Pattern", search_and_collect),
+        ("Search & Collect by Pattern", search_and_collect, None),
     ],
     "🔧 Tools": [
-        ("🔍 Pattern Scanner", show_pattern_scanner),
-        ("📊 Statistics", show_statistics),
-        ("🔄 View History & Undo", show_undo_window),
+        ("🔍 Pattern Scanner", show_pattern_scanner, None),
+        ("📊 Statistics", show_statistics, None),
+        ("🔄 View History & Undo", show_undo_window, None),
     ],
     "📊 Database Scanner": [
-        ("📊 Scan & Learn", show_database_scanner),
+        ("📊 Scan & Learn", show_database_scanner, None),
     ],
 }
 
@@ -5123,46 +5443,58 @@ def create_scrollable_tab(parent):
     content.bind("<Configure>", on_configure)
     canvas.bind("<Configure>", on_canvas_configure)
 
-    # Mouse wheel scrolling
-    def on_mousewheel(event):
-        if hasattr(event, "delta") and event.delta:
-            canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
-        elif hasattr(event, "num"):
-            if event.num == 4:
-                canvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                canvas.yview_scroll(1, "units")
-
-    canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-    canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+    # Mouse wheel scrolling is handled by route_mousewheel
+    canvas._is_scroll_canvas = True
 
     return content
 
+def find_scroll_canvas(event):
+    """Return the scrollable-tab canvas under the pointer, or None"""
+    try:
+        widget = root.winfo_containing(event.x_root, event.y_root)
+    except KeyError:
+        return None  # Pointer is over a Tk-internal widget (e.g. a combobox popdown)
+    while widget is not None and not getattr(widget, "_is_scroll_canvas", False):
+        widget = widget.master
+    return widget
+
+# The wheel event format is fixed per platform, so pick the handler once:
+# X11 reports Button-4/5 presses, Windows and macOS report <MouseWheel> deltas
+if platform.system() == "Linux":
+    def route_mousewheel(event):
+        canvas = find_scroll_canvas(event)
+        if canvas is not None:
+            canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+
+    # One global binding for every scroll frame instead of rebinding on <Enter>/<Leave>
+    root.bind_all("<Button-4>", route_mousewheel)
+    root.bind_all("<Button-5>", route_mousewheel)
+else:
+    def route_mousewheel(event):
+        canvas = find_scroll_canvas(event)
+        if canvas is not None and event.delta:
+            canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
+    # One global binding for every scroll frame instead of rebinding on <Enter>/<Leave>
+    root.bind_all("<MouseWheel>", route_mousewheel)
+
 # Create notebook for tabs
 notebook = ttk.Notebook(root)
 notebook.grid(row=2, column=0, columnspan=3, sticky="nsew", pady=(0, 8))
 
 # Create tabs
 tabs = {}
+tab_names_by_frame = {}
 for tab_name, section_list in tab_groups.items():
     tab_frame = ttk.Frame(notebook)
     tab_frame.columnconfigure(0, weight=1)
     tab_frame.rowconfigure(0, weight=1)
     notebook.add(tab_frame, text=tab_name)
     tabs[tab_name] = create_scrollable_tab(tab_frame)
+    tab_names_by_frame[str(tab_frame)] = tab_name
 
-# Render sections into tabs
-for title in sorted(sections.keys()):
-    # Find which tab this section belongs to
-    target_tab = None
-    for tab_name, section_list in tab_groups.items():
-        if title in section_list:
-            target_tab = tabs[tab_name]
-            break
-
-    if not target_tab:
-        continue  # Skip sections not in any tab
-
+def render_section(target_tab, title):
+    """Render one section's widgets into its tab"""
     if title == "📁 Folder Tools":
         # Add special section with checkboxes for folder creation
         sect = ttk.LabelFrame(target_tab, text=title, style="Section.TLabelframe")
@@ -5211,6 +5543,31 @@ for title in sorted(sections.keys()):
     else:
         add_section(target_tab, title, sections[title])
 
+# Render sections lazily: a tab's widgets are built the first time it is shown
+built_tabs = set()
+
+# Each tab's renderable sections, filtered and sorted once
+tab_sections = {
+    tab_name: sorted(title for title in section_list if title in sections)
+    for tab_name, section_list in tab_groups.items()
+}
+
+def build_tab(tab_name):
+    if tab_name in built_tabs:
+        return
+    built_tabs.add(tab_name)
+    target_tab = tabs[tab_name]
+    for title in tab_sections[tab_name]:
+        render_section(target_tab, title)
+
+def on_tab_changed(event):
+    tab_name = tab_names_by_frame.get(notebook.select())
+    if tab_name:
+        build_tab(tab_name)
+
+notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+build_tab(next(iter(tab_groups)))  # The first tab is visible at startup
+
 progress_bar = ttk.Progressbar(root, orient="horizontal", mode="determinate")
 progress_bar.grid(row=3, column=0, columnspan=3, padx=4, pady=(0, 10), sticky="ew")
 
@@ -5242,11 +5599,27 @@ ttk.Label(footer, text=VERSION, foreground="gray").grid(row=0, column=3, pady=2)
 
 # DnD Support
 if dnd_available:
-    def drop(event):
-        paths = [p.strip('{}') for p in event.data.split() if os.path.isdir(p.strip('{}'))]
+    def fill_source_entry(paths):
+        source_entry.delete(0, tk.END)
+        source_entry.insert(0, ', '.join(paths))
+
+    # Stat the dropped paths off the Tk thread; slow shares must not stall the UI
+    def validate_dropped_paths(candidates):
+        is_dir = {}
+        for p in candidates:
+            if p not in is_dir:
+                is_dir[p] = os.path.isdir(p)
+        paths = [p for p in candidates if is_dir[p]]
         if paths:
-            source_entry.delete(0, tk.END)
-            source_entry.insert(0, ', '.join(paths))
+            try:
+                root.after(0, fill_source_entry, paths)
+            except (RuntimeError, tk.TclError):
+                # The app was closed while the paths were being checked
+                pass
+
+    def drop(event):
+        candidates = [p.strip('{}') for p in event.data.split()]
+        threading.Thread(target=validate_dropped_paths, args=(candidates,), daemon=True).start()
     source_entry.drop_target_register(DND_FILES)
     source_entry.dnd_bind('<<Drop>>', drop)
 
@@ -5257,9 +5630,8 @@ root.grid_columnconfigure(0, weight=1)
 root.grid_columnconfigure(1, weight=1)
 root.grid_columnconfigure(2, weight=1)
 
-# Show welcome message
-def show_welcome():
-    welcome = f"""
+# Show welcome message (built once; VERSION and the data directory are fixed at startup)
+WELCOME_TEXT = f"""
 Welcome to File Organizer — {VERSION}!
 
 🧠 AI SCANNER TAB (NEW!):
@@ -5281,10 +5653,12 @@ Welcome to File Organizer — {VERSION}!
 
 Ready to organize! Try the 🧠 AI Scanner tab!
 """
-    preview_text.insert("1.0", welcome)
+
+def show_welcome():
+    preview_text.insert("1.0", WELCOME_TEXT)
 
 root.after(100, show_welcome)
-root.after(150, load_recent_directories)  # v6.3: Load recent directories on startup
+root.after_idle(load_recent_directories)  # v6.3: Load recent directories on startup (CONFIG is already in memory)
 
 # START GUI
 root.mainloop()
@@ -0,0 +1,50 @@
+"""
+Shared test setup for File Organizer
+
+Puts src/ on the import path once and, because file_organizer builds its
+Tk window at import time, replaces tkinter (and the optional tkinterdnd2)
+with mocks. Every test module imports this before file_organizer, so the
+tests run the same under pytest (any import mode), unittest or plain
+`python`.
+"""
+
+import json
+import os
+import sys
+import unittest.mock as mock
+
+# Optional: faster JSON encoding for test fixtures
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+TK_MODULES = (
+    'tkinter',
+    'tkinter.ttk',
+    'tkinter.filedialog',
+    'tkinter.messagebox',
+    'tkinter.simpledialog',
+    'tkinterdnd2',
+)
+
+# Installed once per process; later imports of this module are no-ops
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+for _name in TK_MODULES:
+    if not isinstance(sys.modules.get(_name), mock.MagicMock):
+        sys.modules[_name] = mock.MagicMock()
+
+
+def dump_json(obj, path):
+    """Write obj as a JSON fixture file (orjson when installed, else json)"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f)
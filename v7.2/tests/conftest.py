@@ -0,0 +1,17 @@
+"""
+pytest hooks for File Organizer
+
+The shared setup lives in _harness.py. Importing it here installs the
+tkinter mocks before pytest collects any test module; the tests directory
+is put on the path first so `import _harness` also resolves under
+--import-mode=importlib, which does not add it.
+"""
+
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TESTS_DIR not in sys.path:
+    sys.path.insert(0, TESTS_DIR)
+
+import _harness  # noqa: E402,F401
@@ -0,0 +1,67 @@
+"""
+Run the unit test modules in parallel, one process per module
+
+Usage: python tests/run_parallel.py [-j WORKERS]
+
+Each module runs in its own interpreter, so the tkinter mocks and the
+module-level singletons in file_organizer are never shared between
+workers. With pytest available, `pytest -n auto` (pytest-xdist) does the
+same job; this runner only needs the standard library.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# unittest's exit code when a module has no tests (Python 3.12+)
+NO_TESTS_RAN = 5
+
+
+def find_test_modules():
+    """Return the unittest module names in this directory"""
+    return sorted(
+        name[:-3] for name in os.listdir(TESTS_DIR)
+        if name.startswith('test_') and name.endswith('.py')
+    )
+
+
+def run_module(module):
+    """Run one test module in a child interpreter; returns (module, returncode, output)"""
+    proc = subprocess.run(
+        [sys.executable, '-m', 'unittest', '-q', module],
+        cwd=TESTS_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return module, proc.returncode, proc.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the unit test modules in parallel")
+    parser.add_argument('-j', '--workers', type=int, default=min(8, os.cpu_count() or 1),
+                        help="number of modules to run at once")
+    args = parser.parse_args()
+
+    modules = find_test_modules()
+    failed = []
+
+    # Threads only wait on the child processes, so the GIL is not a bottleneck
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for module, returncode, output in pool.map(run_module, modules):
+            ok = returncode in (0, NO_TESTS_RAN)
+            print(f"[{'PASS' if ok else 'FAIL'}] {module}")
+            if not ok:
+                failed.append(module)
+                print(output)
+
+    print(f"\n{len(modules) - len(failed)}/{len(modules)} modules passed")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
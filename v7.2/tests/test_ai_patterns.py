@@ -8,19 +8,9 @@ import sys
 import os
 import tempfile
 import shutil
-import json
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-# Mock tkinter before importing
-import unittest.mock as mock
-sys.modules['tkinter'] = mock.MagicMock()
-sys.modules['tkinter.ttk'] = mock.MagicMock()
-sys.modules['tkinter.filedialog'] = mock.MagicMock()
-sys.modules['tkinter.messagebox'] = mock.MagicMock()
-sys.modules['tkinter.simpledialog'] = mock.MagicMock()
-sys.modules['tkinterdnd2'] = mock.MagicMock()
+# Put src/ on the path and mock tkinter before importing (see _harness.py)
+import _harness
 
 
 class TestPatternImportExport(unittest.TestCase):
@@ -67,8 +57,7 @@ class TestPatternImportExport(unittest.TestCase):
             test_data = {
                 "TEXT-NNN": {"folder": "Documents", "count": 5, "confidence": 95}
             }
-            with open(test_file, 'w') as f:
-                json.dump(test_data, f)
+            _harness.dump_json(test_data, test_file)
 
             # This would call import with the file
             self.assertTrue(os.path.exists(test_file))
@@ -10,17 +10,33 @@ Version: 1.0
 Date: 2025-11-06
 """
 
+import argparse
 import os
 import sys
 import time
-import shutil
 import hashlib
 import tempfile
+import threading
+import unittest
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+# Optional: blake3 for faster duplicate hashing (falls back to hashlib.blake2b)
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Directory of this script: reports are saved here and master_file_6_3 is
+# imported from here (resolved once, not per report)
+_REPORT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -34,8 +50,86 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Pre-encoded "[STATUS] " prefixes for result lines (ANSI codes are pure ASCII)
+STATUS_PREFIXES = {
+    status: f"{color}[{status}]{Colors.ENDC} ".encode('ascii')
+    for status, color in (
+        ("PASSED", Colors.OKGREEN),
+        ("FAILED", Colors.FAIL),
+        ("SKIPPED", Colors.WARNING),
+    )
+}
+
+
+# Category banners are skipped when stdout is piped (CI logs, xdist workers)
+_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+# Full-width rule used above and below each category name
+_BAR = f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n"
+
+
+def category_banner(name: str) -> str:
+    """Three-line category header, written to stdout in a single call"""
+    return f"\n{_BAR}{Colors.HEADER}{name}{Colors.ENDC}\n{_BAR}"
+
+
+def write_fixture(path: str, content: bytes = b""):
+    """Create a fixture file with raw os calls (no text-layer wrapper)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if content:
+            os.write(fd, content)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1024)
+def _cached_digest(path: str, mtime_ns: int, size: int) -> str:
+    """Content hash of a file; mtime_ns and size are only part of the cache key"""
+    # Only equality matters here, so any fast hash will do
+    if BLAKE3_AVAILABLE:
+        # Hashes the memory-mapped file, no intermediate bytes (blake3 >= 0.4)
+        hasher = blake3.blake3()
+        hasher.update_mmap(path)
+        return hasher.hexdigest()
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+: streams in C
+            return hashlib.file_digest(f, hashlib.blake2b).hexdigest()
+        return hashlib.blake2b(f.read()).hexdigest()
+
+
+def get_hash(filepath: str) -> str:
+    """Content hash of a file, re-read only when its mtime or size changes"""
+    st = os.stat(filepath)
+    return _cached_digest(filepath, st.st_mtime_ns, st.st_size)
+
+
+def _try_mkdir(path: str) -> bool:
+    """Create a directory without a follow-up stat; False if it already existed"""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        return False
+    return True
+
+
+def _mkdir_all(paths: List[str]) -> int:
+    """Create independent directories concurrently; returns how many were created"""
+    # os.mkdir releases the GIL, so the directory inserts overlap
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return sum(pool.map(_try_mkdir, paths))
+
+
 class TestResult:
     """Store test results"""
+    __test__ = False  # not a test class, despite the name
+
+    __slots__ = (
+        'tests_run', 'tests_passed', 'tests_failed', 'tests_skipped',
+        'results', 'start_time', '_print_buf', '_encoding', '_message_prefix',
+        '_lock', '_local', '_ts_cache_sec', '_ts_cache_str', '_sum_cache',
+    )
+
     def __init__(self):
         self.tests_run = 0
         self.tests_passed = 0
@@ -43,33 +137,87 @@ class TestResult:
         self.tests_skipped = 0
         self.results = []
         self.start_time = time.time()
+        # Last formatted result timestamp and the whole second it was made for
+        self._ts_cache_sec = -1
+        self._ts_cache_str = ""
+        # Result counts -> formatted failed-tests section (see get_summary)
+        self._sum_cache: Dict[Tuple[int, int, int, int], str] = {}
+        # Result lines are encoded as they arrive and written in one batch
+        # per category straight to the binary stdout (see flush)
+        self._print_buf: List[bytes] = []
+        self._encoding = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+        self._message_prefix = "  └─ ".encode(self._encoding, 'replace')
+        self._lock = threading.Lock()
+        # Per-thread list that add_result fills instead of recording (see capture)
+        self._local = threading.local()
+
+    def capture(self, test) -> List[Tuple[str, bool, str, bool]]:
+        """Run test and return its add_result calls instead of recording them"""
+        self._local.pending = pending = []
+        try:
+            test()
+        finally:
+            self._local.pending = None
+        return pending
 
     def add_result(self, test_name: str, passed: bool, message: str = "", skipped: bool = False):
-        """Add a test result"""
-        self.tests_run += 1
+        """Add a test result (safe to call from worker threads)"""
+        pending = getattr(self._local, 'pending', None)
+        if pending is not None:
+            pending.append((test_name, passed, message, skipped))
+            return
+
         if skipped:
-            self.tests_skipped += 1
             status = "SKIPPED"
-            color = Colors.WARNING
         elif passed:
-            self.tests_passed += 1
             status = "PASSED"
-            color = Colors.OKGREEN
         else:
-            self.tests_failed += 1
             status = "FAILED"
-            color = Colors.FAIL
 
-        self.results.append({
-            'test': test_name,
-            'status': status,
-            'message': message,
-            'timestamp': datetime.now().strftime("%H:%M:%S")
-        })
-
-        print(f"{color}[{status}]{Colors.ENDC} {test_name}")
-        if message:
-            print(f"  └─ {message}")
+        with self._lock:
+            self.tests_run += 1
+            if skipped:
+                self.tests_skipped += 1
+            elif passed:
+                self.tests_passed += 1
+            else:
+                self.tests_failed += 1
+
+            self.results.append({
+                'test': test_name,
+                'status': status,
+                'message': message,
+                'timestamp': self._timestamp()
+            })
+
+            self._print_buf.append(STATUS_PREFIXES[status])
+            self._print_buf.append(test_name.encode(self._encoding, 'replace') + b"\n")
+            if message:
+                self._print_buf.append(self._message_prefix)
+                self._print_buf.append(message.encode(self._encoding, 'replace') + b"\n")
+
+    def _timestamp(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._ts_cache_sec:
+            self._ts_cache_sec = now
+            self._ts_cache_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._ts_cache_str
+
+    def flush(self):
+        """Write the buffered result lines to stdout in a single call"""
+        data = b"".join(self._print_buf)
+        self._print_buf.clear()
+        binary_out = getattr(sys.stdout, 'buffer', None)
+        if binary_out is None:
+            # Streams without a binary layer (IDE consoles, captured output)
+            sys.stdout.write(data.decode(self._encoding, 'replace'))
+            sys.stdout.flush()
+            return
+        # Flush earlier print() output first so lines stay in order
+        sys.stdout.flush()
+        binary_out.write(data)
+        binary_out.flush()
 
     def get_summary(self) -> str:
         """Generate summary report"""
@@ -86,17 +234,38 @@ class TestResult:
         summary += f"{'='*80}\n"
 
         if self.tests_failed > 0:
-            summary += f"\n{Colors.FAIL}Failed Tests:{Colors.ENDC}\n"
-            for result in self.results:
-                if result['status'] == 'FAILED':
-                    summary += f"  - {result['test']}: {result['message']}\n"
+            summary += self._failed_section()
 
         return summary
 
+    def _failed_section(self) -> str:
+        """Failed-test listing, rebuilt only after new results are added"""
+        # The duration line changes on every call, so only this part is cached
+        key = (self.tests_run, self.tests_passed, self.tests_failed, self.tests_skipped)
+        cached = self._sum_cache.get(key)
+        if cached is not None:
+            return cached
+
+        section = f"\n{Colors.FAIL}Failed Tests:{Colors.ENDC}\n"
+        for result in self.results:
+            if result['status'] == 'FAILED':
+                section += f"  - {result['test']}: {result['message']}\n"
+        self._sum_cache[key] = section
+        return section
+
 
 class FileOrganizerTester:
     """Comprehensive test suite for File Organizer v6.3"""
 
+    __slots__ = (
+        'test_result', 'temp_dir', 'source_dir', 'target_dir', 'test_files',
+        'organizer', '_by_ext', '_by_alpha', '_by_num', '_by_imgdsc',
+        '_by_detected', '_by_seq', '_sanitize', '_analyze',
+    )
+
+    # Fixtures whose contents a test reads; all others are zero-byte files
+    NEEDS_CONTENT = frozenset({"duplicate1.txt", "duplicate2.txt"})
+
     def __init__(self):
         self.test_result = TestResult()
         self.temp_dir = None
@@ -107,7 +276,7 @@ class FileOrganizerTester:
         # Try to import the main program
         try:
             # Add the v6.3 directory to path
-            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+            sys.path.insert(0, _REPORT_DIR)
 
             # Import necessary functions from master file
             import master_file_6_3 as organizer
@@ -117,12 +286,32 @@ class FileOrganizerTester:
             print(f"{Colors.FAIL}✗{Colors.ENDC} Failed to import File Organizer: {e}")
             sys.exit(1)
 
-    def setup_test_environment(self):
-        """Create temporary test environment with sample files"""
+        # Resolve the functions under test once rather than in every test
+        self._by_ext = self._resolve('by_extension')
+        self._by_alpha = self._resolve('by_alphabet')
+        self._by_num = self._resolve('by_numeric_simple')
+        self._by_imgdsc = self._resolve('by_img_dsc')
+        self._by_detected = self._resolve('by_detected')
+        self._by_seq = self._resolve('by_sequential')
+        self._sanitize = self._resolve('sanitize_folder_name')
+        self._analyze = self._resolve('analyze_filename_patterns')
+
+    def _resolve(self, name: str):
+        """Look up an organizer function; a missing one fails only its own test"""
+        func = getattr(self.organizer, name, None)
+        if func is not None:
+            return func
+
+        def missing(*args, **kwargs):
+            raise AttributeError(f"module '{self.organizer.__name__}' has no attribute '{name}'")
+        return missing
+
+    def setup_test_environment(self, temp_dir: str):
+        """Create test environment with sample files inside temp_dir"""
         print(f"\n{Colors.HEADER}Setting up test environment...{Colors.ENDC}")
 
-        # Create temp directory
-        self.temp_dir = tempfile.mkdtemp(prefix="file_org_test_")
+        # temp_dir is owned (and removed) by the caller's TemporaryDirectory
+        self.temp_dir = temp_dir
         self.source_dir = os.path.join(self.temp_dir, "source")
         self.target_dir = os.path.join(self.temp_dir, "target")
 
@@ -188,151 +377,102 @@ class FileOrganizerTester:
             "PRN_test.txt",
         ]
 
-        # Create actual files with content
-        for filename in self.test_files:
-            filepath = os.path.join(self.source_dir, filename)
+        # mkdtemp paths are absolute with no trailing separator, so plain
+        # concatenation gives the same result as os.path.join
+        assert os.path.isabs(self.source_dir) and not self.source_dir.endswith(os.sep)
+        prefix = self.source_dir + os.sep
 
-            # Create file with unique content (except duplicates)
-            if "duplicate" in filename:
-                content = "This is duplicate content"
+        # Only the duplicate pair is ever read (and hashed); every other test
+        # looks at names alone, so the rest are created empty
+        duplicate_content = b"This is duplicate content"
+        for filename in self.test_files:
+            if filename in self.NEEDS_CONTENT:
+                write_fixture(prefix + filename, duplicate_content)
             else:
-                content = f"Test content for {filename}\n" * 10
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+                write_fixture(prefix + filename)
 
         # Create subdirectories with files for extract tests
-        subdir1 = os.path.join(self.source_dir, "subfolder1")
-        subdir2 = os.path.join(self.source_dir, "subfolder2")
-        os.makedirs(subdir1)
-        os.makedirs(subdir2)
+        # (source_dir already exists, so a plain mkdir is enough)
+        subdir1 = prefix + "subfolder1"
+        subdir2 = prefix + "subfolder2"
+        os.mkdir(subdir1)
+        os.mkdir(subdir2)
 
-        with open(os.path.join(subdir1, "nested_file1.txt"), 'w') as f:
-            f.write("Nested file 1")
-        with open(os.path.join(subdir2, "nested_file2.txt"), 'w') as f:
-            f.write("Nested file 2")
+        write_fixture(subdir1 + os.sep + "nested_file1.txt", b"Nested file 1")
+        write_fixture(subdir2 + os.sep + "nested_file2.txt", b"Nested file 2")
 
         print(f"{Colors.OKGREEN}✓{Colors.ENDC} Created test environment:")
         print(f"  Source: {self.source_dir}")
         print(f"  Target: {self.target_dir}")
         print(f"  Test files: {len(self.test_files)}")
 
-    def cleanup_test_environment(self):
-        """Remove temporary test environment"""
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-                print(f"{Colors.OKGREEN}✓{Colors.ENDC} Cleaned up test environment")
-            except Exception as e:
-                print(f"{Colors.WARNING}⚠{Colors.ENDC} Failed to cleanup: {e}")
-
     # ==========================
     # ORGANIZATION MODE TESTS
     # ==========================
 
-    def test_organization_by_extension(self):
-        """Test organizing files by extension"""
-        test_name = "Organization Mode: By Extension"
+    # Data-driven cases for the organization modes: (label, filename, expected)
+    _EXTENSION_CASES = (
+        ("PDF", "test.pdf", ".pdf"),
+        ("JPG", "photo.jpg", ".jpg"),
+        ("None", "no_extension", "no_extension"),
+    )
+    _ALPHA_CASES = (
+        ("A", "apple.txt", "A"),
+        ("B", "Banana.txt", "B"),
+        ("Num", "123.txt", "0-9"),
+        ("Spec", "!special.txt", "!@#$"),
+    )
+    _NUMERIC_CASES = (
+        ("1", "1.txt", "1"),
+        ("42", "42.txt", "42"),
+        ("Text", "not_numeric.txt", "Others"),
+    )
+    _IMG_DSC_CASES = (
+        ("IMG", "IMG_001.jpg", "IMG"),
+        ("DSC", "DSC_123.jpg", "DSC"),
+        ("DSCN", "DSCN_456.jpg", "DSCN"),
+        ("Regular", "regular.jpg", "Others"),
+    )
+
+    def _run_mode_cases(self, test_name: str, func, cases: Tuple):
+        """Run one organizer function over (label, filename, expected) cases"""
         try:
-            # Get the function
-            func = self.organizer.by_extension
-
-            # Test with known extensions
-            result1 = func("test.pdf")
-            result2 = func("photo.jpg")
-            result3 = func("no_extension")
-
-            passed = (result1 == ".pdf" and
-                     result2 == ".jpg" and
-                     result3 == "no_extension")
+            got = tuple(map(func, [filename for _, filename, _ in cases]))
+            passed = got == tuple(expected for _, _, expected in cases)
 
             self.test_result.add_result(
                 test_name,
                 passed,
-                f"PDF→{result1}, JPG→{result2}, None→{result3}"
+                ", ".join(f"{label}→{result}" for (label, _, _), result in zip(cases, got))
             )
         except Exception as e:
             self.test_result.add_result(test_name, False, f"Exception: {e}")
 
+    def test_organization_by_extension(self):
+        """Test organizing files by extension"""
+        self._run_mode_cases("Organization Mode: By Extension", self._by_ext, self._EXTENSION_CASES)
+
     def test_organization_by_alphabet(self):
         """Test organizing files by first letter"""
-        test_name = "Organization Mode: By Alphabet"
-        try:
-            func = self.organizer.by_alphabet
-
-            result1 = func("apple.txt")
-            result2 = func("Banana.txt")
-            result3 = func("123.txt")
-            result4 = func("!special.txt")
-
-            passed = (result1 == "A" and
-                     result2 == "B" and
-                     result3 == "0-9" and
-                     result4 == "!@#$")
-
-            self.test_result.add_result(
-                test_name,
-                passed,
-                f"A→{result1}, B→{result2}, Num→{result3}, Spec→{result4}"
-            )
-        except Exception as e:
-            self.test_result.add_result(test_name, False, f"Exception: {e}")
+        self._run_mode_cases("Organization Mode: By Alphabet", self._by_alpha, self._ALPHA_CASES)
 
     def test_organization_by_numeric(self):
         """Test organizing numeric files"""
-        test_name = "Organization Mode: By Numeric"
-        try:
-            func = self.organizer.by_numeric_simple
-
-            result1 = func("1.txt")
-            result2 = func("42.txt")
-            result3 = func("not_numeric.txt")
-
-            passed = (result1 == "1" and
-                     result2 == "42" and
-                     result3 == "Others")
-
-            self.test_result.add_result(
-                test_name,
-                passed,
-                f"1→{result1}, 42→{result2}, Text→{result3}"
-            )
-        except Exception as e:
-            self.test_result.add_result(test_name, False, f"Exception: {e}")
+        self._run_mode_cases("Organization Mode: By Numeric", self._by_num, self._NUMERIC_CASES)
 
     def test_organization_by_img_dsc(self):
         """Test organizing camera files (IMG/DSC)"""
-        test_name = "Organization Mode: By IMG/DSC Tags"
-        try:
-            func = self.organizer.by_img_dsc
-
-            result1 = func("IMG_001.jpg")
-            result2 = func("DSC_123.jpg")
-            result3 = func("DSCN_456.jpg")
-            result4 = func("regular.jpg")
-
-            passed = (result1 == "IMG" and
-                     result2 == "DSC" and
-                     result3 == "DSCN" and
-                     result4 == "Others")
-
-            self.test_result.add_result(
-                test_name,
-                passed,
-                f"IMG→{result1}, DSC→{result2}, DSCN→{result3}, Regular→{result4}"
-            )
-        except Exception as e:
-            self.test_result.add_result(test_name, False, f"Exception: {e}")
+        self._run_mode_cases("Organization Mode: By IMG/DSC Tags", self._by_imgdsc, self._IMG_DSC_CASES)
 
     def test_organization_smart_pattern(self):
         """Test smart pattern detection"""
         test_name = "Organization Mode: Smart Pattern Detection"
         try:
-            func = self.organizer.by_detected
+            func = self._by_detected
 
-            result1 = func("vacation-001.jpg")
-            result2 = func("work_file_001.docx")
-            result3 = func("IMG_001.jpg")
+            result1, result2, result3 = map(
+                func, ("vacation-001.jpg", "work_file_001.docx", "IMG_001.jpg")
+            )
 
             passed = (result1 in ["vacation", "vacation-"] and
                      "work" in result2.lower() and
@@ -350,11 +490,11 @@ class FileOrganizerTester:
         """Test sequential pattern detection"""
         test_name = "Organization Mode: Sequential Pattern"
         try:
-            func = self.organizer.by_sequential
+            func = self._by_seq
 
-            result1 = func("report-001-final.pdf")
-            result2 = func("photo_123.jpg")
-            result3 = func("no_sequence.txt")
+            result1, result2, result3 = map(
+                func, ("report-001-final.pdf", "photo_123.jpg", "no_sequence.txt")
+            )
 
             # Sequential should detect patterns with numbers
             passed = result1 is not None and result2 is not None
@@ -380,12 +520,9 @@ class FileOrganizerTester:
             os.makedirs(folder_test_dir)
 
             # Create A-Z folders
-            created = 0
-            for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                folder_path = os.path.join(folder_test_dir, letter)
-                os.makedirs(folder_path, exist_ok=True)
-                if os.path.exists(folder_path):
-                    created += 1
+            created = _mkdir_all(
+                [os.path.join(folder_test_dir, letter) for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ']
+            )
 
             passed = created == 26
 
@@ -404,12 +541,9 @@ class FileOrganizerTester:
             folder_test_dir = os.path.join(self.temp_dir, "folder_test_numeric")
             os.makedirs(folder_test_dir)
 
-            created = 0
-            for num in range(10):
-                folder_path = os.path.join(folder_test_dir, str(num))
-                os.makedirs(folder_path, exist_ok=True)
-                if os.path.exists(folder_path):
-                    created += 1
+            created = _mkdir_all(
+                [os.path.join(folder_test_dir, str(num)) for num in range(10)]
+            )
 
             passed = created == 10
 
@@ -427,11 +561,8 @@ class FileOrganizerTester:
         try:
             # Search for IMG* pattern
             pattern = "IMG*"
-            matches = []
-
-            for filename in os.listdir(self.source_dir):
-                if filename.startswith("IMG"):
-                    matches.append(filename)
+            with os.scandir(self.source_dir) as it:
+                matches = [entry.name for entry in it if entry.name.startswith("IMG")]
 
             passed = len(matches) >= 2  # Should find IMG_001, IMG_002, etc.
 
@@ -449,8 +580,8 @@ class FileOrganizerTester:
         try:
             # Simulate recent directory tracking
             recent_dirs = {
-                'source': [],
-                'target': []
+                'source': OrderedDict(),
+                'target': OrderedDict()
             }
 
             # Add some directories
@@ -460,13 +591,14 @@ class FileOrganizerTester:
                 "C:/Users/Test/Pictures"
             ]
 
+            # Most recent first, like add_to_recent; re-adding moves to the front
             for path in test_paths:
-                if path not in recent_dirs['source']:
-                    recent_dirs['source'].append(path)
+                recent_dirs['source'][path] = None
+                recent_dirs['source'].move_to_end(path, last=False)
 
             # Test that we can store and retrieve
             passed = (len(recent_dirs['source']) == 3 and
-                     recent_dirs['source'][0] == test_paths[0])
+                     next(iter(recent_dirs['source'])) == test_paths[-1])
 
             self.test_result.add_result(
                 test_name,
@@ -508,12 +640,6 @@ class FileOrganizerTester:
             dup2 = os.path.join(self.source_dir, "duplicate2.txt")
 
             # Calculate hashes
-            def get_hash(filepath):
-                md5 = hashlib.md5()
-                with open(filepath, 'rb') as f:
-                    md5.update(f.read())
-                return md5.hexdigest()
-
             hash1 = get_hash(dup1)
             hash2 = get_hash(dup2)
 
@@ -531,7 +657,7 @@ class FileOrganizerTester:
         """Test Windows reserved name sanitization"""
         test_name = "Security Feature: Reserved Name Sanitization"
         try:
-            func = self.organizer.sanitize_folder_name
+            func = self._sanitize
 
             result1 = func("CON")
             result2 = func("PRN")
@@ -556,7 +682,7 @@ class FileOrganizerTester:
         """Test pattern analysis scanner"""
         test_name = "Core Feature: Pattern Scanner"
         try:
-            func = self.organizer.analyze_filename_patterns
+            func = self._analyze
 
             test_filenames = [
                 "vacation-001.jpg",
@@ -634,9 +760,9 @@ class FileOrganizerTester:
             with open(test_file, 'w') as f:
                 f.write("nested content")
 
-            # Move to parent
+            # Move to parent (same filesystem, so a plain rename is enough)
             parent_file = os.path.join(extract_test, "nested.txt")
-            shutil.move(test_file, parent_file)
+            os.rename(test_file, parent_file)
 
             passed = os.path.exists(parent_file) and not os.path.exists(test_file)
 
@@ -827,16 +953,12 @@ class FileOrganizerTester:
         test_name = "Edge Case: Deeply Nested Structure"
         try:
             # Create deep nesting
-            deep_path = self.temp_dir
-            for i in range(5):
-                deep_path = os.path.join(deep_path, f"level{i}")
-
-            os.makedirs(deep_path)
+            deep_path = os.path.join(self.temp_dir, *(f"level{i}" for i in range(5)))
+            os.makedirs(deep_path, exist_ok=True)
 
             # Create file in deep location
             deep_file = os.path.join(deep_path, "deep_file.txt")
-            with open(deep_file, 'w') as f:
-                f.write("deeply nested")
+            write_fixture(deep_file, b"deeply nested")
 
             passed = os.path.exists(deep_file)
 
@@ -852,8 +974,14 @@ class FileOrganizerTester:
     # MAIN TEST RUNNER
     # ==========================
 
-    def run_all_tests(self):
-        """Run all test suites"""
+    def run_all_tests(self, quiet: bool = False):
+        """Run all test suites (category banners only on a terminal, not quiet)"""
+        show_banners = _TTY and not quiet
+
+        def banner(name: str):
+            if show_banners:
+                sys.stdout.write(category_banner(name))
+
         print(f"\n{Colors.HEADER}{Colors.BOLD}")
         print("="*80)
         print("FILE ORGANIZER v6.3 - COMPREHENSIVE TEST SUITE")
@@ -862,68 +990,84 @@ class FileOrganizerTester:
 
         print(f"\n{Colors.OKBLUE}Starting test execution...{Colors.ENDC}\n")
 
-        # Setup
-        self.setup_test_environment()
-
-        print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
-        print(f"{Colors.HEADER}CATEGORY 1: ORGANIZATION MODES (7 tests){Colors.ENDC}")
-        print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-
-        self.test_organization_by_extension()
-        self.test_organization_by_alphabet()
-        self.test_organization_by_numeric()
-        self.test_organization_by_img_dsc()
-        self.test_organization_smart_pattern()
-        self.test_organization_sequential()
-
-        print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
-        print(f"{Colors.HEADER}CATEGORY 2: v6.3 NEW FEATURES (4 tests){Colors.ENDC}")
-        print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-
-        self.test_folder_creation_az()
-        self.test_folder_creation_numeric()
-        self.test_pattern_search()
-        self.test_recent_directories()
-        self.test_tabbed_interface()
-
-        print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
-        print(f"{Colors.HEADER}CATEGORY 3: CORE FEATURES (7 tests){Colors.ENDC}")
-        print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-
-        self.test_duplicate_detection()
-        self.test_sanitize_reserved_names()
-        self.test_pattern_scanner()
-        self.test_operation_logging()
-        self.test_config_management()
-        self.test_extract_functionality()
-        self.test_collision_handling()
-
-        print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
-        print(f"{Colors.HEADER}CATEGORY 4: v6.1 & v6.2 FEATURES (3 tests){Colors.ENDC}")
-        print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-
-        self.test_in_place_mode()
-        self.test_skip_folders()
-        self.test_version_constant()
-
-        print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
-        print(f"{Colors.HEADER}CATEGORY 5: PERFORMANCE (2 tests){Colors.ENDC}")
-        print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-
-        self.test_generator_efficiency()
-        self.test_batch_processing()
-
-        print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
-        print(f"{Colors.HEADER}CATEGORY 6: EDGE CASES (3 tests){Colors.ENDC}")
-        print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-
-        self.test_empty_source_directory()
-        self.test_special_characters_in_names()
-        self.test_deeply_nested_structure()
-
-        # Cleanup
-        print(f"\n{Colors.HEADER}Cleaning up...{Colors.ENDC}")
-        self.cleanup_test_environment()
+        # Setup; the directory and everything in it is removed when the
+        # with block exits. A failed removal only warns, so the summary,
+        # report and exit code below still come out.
+        tests_done = False
+        try:
+            with tempfile.TemporaryDirectory(prefix="file_org_test_") as test_dir:
+                self.setup_test_environment(test_dir)
+
+                banner("CATEGORY 1: ORGANIZATION MODES (7 tests)")
+
+                # The organization modes are pure functions of the filename, so these
+                # tests share no state; each worker's results are captured, not recorded
+                org_tests = [
+                    self.test_organization_by_extension,
+                    self.test_organization_by_alphabet,
+                    self.test_organization_by_numeric,
+                    self.test_organization_by_img_dsc,
+                    self.test_organization_smart_pattern,
+                    self.test_organization_sequential,
+                ]
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    captured = list(pool.map(self.test_result.capture, org_tests))
+                # Record in submission order, so the console and report order
+                # does not depend on which worker finished first
+                for calls in captured:
+                    for call in calls:
+                        self.test_result.add_result(*call)
+                self.test_result.flush()
+
+                banner("CATEGORY 2: v6.3 NEW FEATURES (4 tests)")
+
+                self.test_folder_creation_az()
+                self.test_folder_creation_numeric()
+                self.test_pattern_search()
+                self.test_recent_directories()
+                self.test_tabbed_interface()
+                self.test_result.flush()
+
+                banner("CATEGORY 3: CORE FEATURES (7 tests)")
+
+                self.test_duplicate_detection()
+                self.test_sanitize_reserved_names()
+                self.test_pattern_scanner()
+                self.test_operation_logging()
+                self.test_config_management()
+                self.test_extract_functionality()
+                self.test_collision_handling()
+                self.test_result.flush()
+
+                banner("CATEGORY 4: v6.1 & v6.2 FEATURES (3 tests)")
+
+                self.test_in_place_mode()
+                self.test_skip_folders()
+                self.test_version_constant()
+                self.test_result.flush()
+
+                banner("CATEGORY 5: PERFORMANCE (2 tests)")
+
+                self.test_generator_efficiency()
+                self.test_batch_processing()
+                self.test_result.flush()
+
+                banner("CATEGORY 6: EDGE CASES (3 tests)")
+
+                self.test_empty_source_directory()
+                self.test_special_characters_in_names()
+                self.test_deeply_nested_structure()
+                self.test_result.flush()
+
+                # Cleanup
+                tests_done = True
+                print(f"\n{Colors.HEADER}Cleaning up...{Colors.ENDC}")
+        except Exception as e:
+            if not tests_done:
+                raise
+            print(f"{Colors.WARNING}⚠{Colors.ENDC} Failed to cleanup: {e}")
+        else:
+            print(f"{Colors.OKGREEN}✓{Colors.ENDC} Cleaned up test environment")
 
         # Print summary
         print(self.test_result.get_summary())
@@ -936,45 +1080,116 @@ class FileOrganizerTester:
 
     def generate_report(self):
         """Generate detailed test report file"""
-        report_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                    f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+        # One clock read for both the file name and the header
+        now = datetime.now()
+        report_path = os.path.join(_REPORT_DIR, f"test_report_{now.strftime('%Y%m%d_%H%M%S')}.txt")
 
         try:
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write("="*80 + "\n")
-                f.write("FILE ORGANIZER v6.3 - TEST REPORT\n")
-                f.write("="*80 + "\n\n")
-                f.write(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Tests: {self.test_result.tests_run}\n")
-                f.write(f"Passed: {self.test_result.tests_passed}\n")
-                f.write(f"Failed: {self.test_result.tests_failed}\n")
-                f.write(f"Skipped: {self.test_result.tests_skipped}\n")
-                f.write(f"Duration: {time.time() - self.test_result.start_time:.2f}s\n")
-                f.write("\n" + "="*80 + "\n\n")
-
-                f.write("DETAILED RESULTS:\n\n")
-                for result in self.test_result.results:
-                    f.write(f"[{result['timestamp']}] [{result['status']}] {result['test']}\n")
-                    if result['message']:
-                        f.write(f"    {result['message']}\n")
-                    f.write("\n")
+            # Large buffer: the whole report reaches the disk in one write
+            with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(
+                    "="*80 + "\n"
+                    "FILE ORGANIZER v6.3 - TEST REPORT\n"
+                    + "="*80 + "\n\n"
+                    f"Test Date: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"Total Tests: {self.test_result.tests_run}\n"
+                    f"Passed: {self.test_result.tests_passed}\n"
+                    f"Failed: {self.test_result.tests_failed}\n"
+                    f"Skipped: {self.test_result.tests_skipped}\n"
+                    f"Duration: {time.time() - self.test_result.start_time:.2f}s\n"
+                    "\n" + "="*80 + "\n\n"
+                    "DETAILED RESULTS:\n\n"
+                )
+
+                # One preformatted block per result, handed to writelines together
+                f.writelines([
+                    f"[{r['timestamp']}] [{r['status']}] {r['test']}\n"
+                    + (f"    {r['message']}\n" if r['message'] else "")
+                    + "\n"
+                    for r in self.test_result.results
+                ])
 
             print(f"\n{Colors.OKGREEN}✓{Colors.ENDC} Test report saved: {report_path}")
         except Exception as e:
             print(f"{Colors.WARNING}⚠{Colors.ENDC} Failed to save report: {e}")
 
 
+class TestAllFeatures(unittest.TestCase):
+    """Each FileOrganizerTester check as its own test, for pytest/unittest
+
+    All checks share one tester and test environment, so run the module on a
+    single worker: pytest tests -n auto --dist loadfile
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        if _REPORT_DIR not in sys.path:
+            sys.path.insert(0, _REPORT_DIR)
+        try:
+            import master_file_6_3  # noqa: F401
+        except ImportError as e:
+            raise unittest.SkipTest(f"File Organizer v6.3 not importable: {e}")
+
+        cls._temp = tempfile.TemporaryDirectory(prefix="file_org_test_")
+        # Registered first, so the tree is removed even if the setup below raises
+        cls.addClassCleanup(cls._temp.cleanup)
+        cls.tester = FileOrganizerTester()
+        cls.tester.setup_test_environment(cls._temp.name)
+
+    def run_check(self, check_name: str):
+        """Run one tester check and turn its recorded results into an outcome"""
+        results = self.tester.test_result.results
+        first = len(results)
+        getattr(self.tester, check_name)()
+        self.tester.test_result.flush()
+
+        for result in results[first:]:
+            if result['status'] == 'FAILED':
+                self.fail(f"{result['test']}: {result['message']}")
+            if result['status'] == 'SKIPPED':
+                self.skipTest(result['message'])
+
+
+def _make_feature_test(check_name: str):
+    def test(self):
+        self.run_check(check_name)
+    test.__doc__ = getattr(FileOrganizerTester, check_name).__doc__
+    return test
+
+
+# Every test_* method of the tester (test_result/test_files are slots, not checks)
+for _check_name, _member in list(vars(FileOrganizerTester).items()):
+    if _check_name.startswith('test_') and callable(_member):
+        setattr(TestAllFeatures, _check_name, _make_feature_test(_check_name))
+del _check_name, _member
+
+
+def should_pause(no_pause: bool = False) -> bool:
+    """Pause before exit only for an interactive console (e.g. the packaged exe)"""
+    if no_pause or os.environ.get("CI"):
+        return False
+    return sys.stdin is not None and sys.stdin.isatty()
+
+
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="File Organizer v6.3 feature test suite")
+    parser.add_argument('--no-pause', action='store_true',
+                        help="exit without waiting for Enter (also automatic under CI or without a tty)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="omit the category banners (always omitted when output is not a tty)")
+    args = parser.parse_args()
+
     print(f"\n{Colors.BOLD}File Organizer v6.3 - Comprehensive Test Suite{Colors.ENDC}")
     print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     tester = FileOrganizerTester()
-    exit_code = tester.run_all_tests()
+    exit_code = tester.run_all_tests(quiet=args.quiet)
 
     # Pause before exit (useful for exe)
-    print(f"\n{Colors.OKBLUE}Press Enter to exit...{Colors.ENDC}")
-    input()
+    if should_pause(args.no_pause):
+        print(f"\n{Colors.OKBLUE}Press Enter to exit...{Colors.ENDC}")
+        input()
 
     sys.exit(exit_code)
 
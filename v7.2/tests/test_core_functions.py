@@ -11,17 +11,10 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-# Mock tkinter before importing
 import unittest.mock as mock
-sys.modules['tkinter'] = mock.MagicMock()
-sys.modules['tkinter.ttk'] = mock.MagicMock()
-sys.modules['tkinter.filedialog'] = mock.MagicMock()
-sys.modules['tkinter.messagebox'] = mock.MagicMock()
-sys.modules['tkinter.simpledialog'] = mock.MagicMock()
-sys.modules['tkinterdnd2'] = mock.MagicMock()
+
+# Put src/ on the path and mock tkinter before importing (see _harness.py)
+import _harness  # noqa: F401
 
 # Now import from file_organizer
 from file_organizer import (
@@ -31,6 +24,13 @@ from file_organizer import (
     get_file_datetime,
     extract_img_tag,
     detect_sequential_pattern,
+    analyze_filename_patterns,
+    pattern_scan_signature,
+    read_last_lines,
+    build_statistics_sections,
+    OperationLogger,
+    load_pattern_scan_cache,
+    save_pattern_scan_cache,
     smart_title,
     make_key
 )
@@ -188,6 +188,19 @@ class TestPatternDetection(unittest.TestCase):
             result = detect_sequential_pattern(filename)
             self.assertIsNotNone(result)
 
+    def test_detect_sequential_pattern_folder_names(self):
+        """Should derive the folder name from the text before the digits"""
+        test_cases = [
+            ("IMG_0001.jpg", "IMG"),
+            ("IMG_9999.jpg", "IMG"),
+            ("vacation-001.jpg", "Vacation"),
+            ("file001.txt", "File"),
+            ("031204-0022.jpg", "031204"),
+            ("photo-1.jpg", None),
+        ]
+        for filename, expected in test_cases:
+            self.assertEqual(detect_sequential_pattern(filename), expected)
+
     def test_detect_sequential_pattern_no_numbers(self):
         """Should return None for files without sequential numbers"""
         test_cases = ["document.pdf", "photo.jpg", "readme.md"]
@@ -196,6 +209,191 @@ class TestPatternDetection(unittest.TestCase):
             self.assertIsNone(result)
 
 
+class TestAnalyzeFilenamePatterns(unittest.TestCase):
+    """Test the automatic pattern scanner"""
+
+    def test_pattern_keys_are_type_name_tuples(self):
+        """Should key patterns by (type, name) tuples"""
+        patterns = analyze_filename_patterns(["vacation-001.jpg", "vacation-002.jpg", "12345.png"])
+        self.assertIn(('sequence', 'Vacation'), patterns)
+        self.assertIn(('numeric', 12000), patterns)
+        self.assertEqual(patterns[('sequence', 'Vacation')].files,
+                         ["vacation-001.jpg", "vacation-002.jpg"])
+
+    def test_delimiter_pattern_uses_first_two_words(self):
+        """Should group on the first two non-numeric tokens"""
+        patterns = analyze_filename_patterns(["Project_Alpha final.txt", "Project-Alpha-draft.txt"])
+        self.assertEqual(len(patterns[('delimiter', 'Project-Alpha')].files), 2)
+
+    def test_folder_name_is_title_cased_for_word_patterns(self):
+        """Should title-case prefix/delimiter folders and keep other names as-is"""
+        patterns = analyze_filename_patterns(["my photo x.jpg", "DSC_0001.jpg"])
+        self.assertEqual(patterns[('delimiter', 'my-photo')].folder_name, "My-Photo")
+        self.assertEqual(patterns[('sequence', 'DSC')].folder_name, "DSC")
+
+    def test_camera_tag_pattern(self):
+        """Should group standalone camera tags regardless of case"""
+        patterns = analyze_filename_patterns(["x.IMG.jpg", "y.img.jpg", "x.DSCN.jpg"])
+        self.assertEqual(patterns[('camera', 'IMG')].files, ["x.IMG.jpg", "y.img.jpg"])
+        self.assertIn(('camera', 'DSCN'), patterns)
+
+    def test_numeric_buckets(self):
+        """Should group leading numbers into ranges of 1000"""
+        patterns = analyze_filename_patterns(["0042.png", "999.png", "1000 a.png", "12345.png"])
+        self.assertEqual(patterns[('numeric', 0)].files, ["0042.png", "999.png"])
+        self.assertEqual(patterns[('numeric', 0)].folder_name, "0-999")
+        self.assertEqual(patterns[('numeric', 1000)].files, ["1000 a.png"])
+        self.assertEqual(patterns[('numeric', 12000)].files, ["12345.png"])
+
+    def test_common_prefix_discovery(self):
+        """Should group otherwise-unmatched names that share leading text"""
+        patterns = analyze_filename_patterns(
+            ["VacationBeach.jpg", "VacationPool.jpg", "VacationHotel.png", "notes.txt"])
+        self.assertEqual(patterns[('prefix', 'Vacation')].files,
+                         ["VacationBeach.jpg", "VacationPool.jpg", "VacationHotel.png"])
+        self.assertEqual(patterns[('extension', 'TXT')].files, ["notes.txt"])
+
+    def test_common_prefix_needs_whole_word(self):
+        """Names sharing only part of a word should stay in extension groups"""
+        patterns = analyze_filename_patterns(
+            ["contract.pdf", "contacts.vcf", "contour.pdf", "report.pdf", "repair.doc"])
+        self.assertEqual(set(ptype for ptype, _ in patterns), {'extension'})
+        self.assertEqual(patterns[('extension', 'PDF')].files,
+                         ["contract.pdf", "contour.pdf", "report.pdf"])
+
+    def test_fallback_patterns(self):
+        """Should fall back to extension and uncategorized groups"""
+        patterns = analyze_filename_patterns(["notes.txt", "readme"])
+        self.assertEqual(patterns[('extension', 'TXT')].folder_name, "TXT")
+        self.assertEqual(patterns[('uncategorized', 'Other')].folder_name, "Uncategorized")
+
+
+class TestPatternScanCache(unittest.TestCase):
+    """Test persisting Pattern Scanner results between runs"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        cache_path = Path(self.test_dir) / "pattern_scan_cache.json"
+        patcher = mock.patch('file_organizer.DATA_DIR.get_path', return_value=cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Should reload the saved patterns for an identical file list"""
+        filenames = ["vacation-001.jpg", "vacation-002.jpg", "12345.png"]
+        signature = pattern_scan_signature(["/photos"], filenames)
+        patterns = analyze_filename_patterns(filenames)
+        save_pattern_scan_cache(signature, patterns)
+        self.assertEqual(load_pattern_scan_cache(signature), patterns)
+
+    def test_changed_files_miss(self):
+        """Should not reuse results once the file list changes"""
+        signature = pattern_scan_signature(["/photos"], ["a-01.jpg"])
+        save_pattern_scan_cache(signature, analyze_filename_patterns(["a-01.jpg"]))
+        changed = pattern_scan_signature(["/photos"], ["a-01.jpg", "a-02.jpg"])
+        self.assertNotEqual(signature, changed)
+        self.assertIsNone(load_pattern_scan_cache(changed))
+
+    def test_scanner_version_change_misses(self):
+        """Should not reuse results saved by an older scanner version"""
+        signature = pattern_scan_signature(["/photos"], ["a-01.jpg"])
+        save_pattern_scan_cache(signature, analyze_filename_patterns(["a-01.jpg"]))
+        with mock.patch('file_organizer.PATTERN_SCAN_CACHE_VERSION', -1):
+            older = pattern_scan_signature(["/photos"], ["a-01.jpg"])
+        self.assertNotEqual(signature, older)
+        self.assertIsNone(load_pattern_scan_cache(older))
+
+    def test_undecodable_filename_round_trip(self):
+        """Should save and reload names holding surrogate-escaped bytes"""
+        filenames = [os.fsdecode(b"IMG_\xff001.jpg")]
+        signature = pattern_scan_signature(["/photos"], filenames)
+        patterns = analyze_filename_patterns(filenames)
+        save_pattern_scan_cache(signature, patterns)
+        self.assertEqual(load_pattern_scan_cache(signature), patterns)
+
+    def test_non_object_cache_ignored(self):
+        """Should treat valid JSON that is not an object as a cache miss"""
+        (Path(self.test_dir) / "pattern_scan_cache.json").write_text("[1, 2]", encoding='utf-8')
+        self.assertIsNone(load_pattern_scan_cache("anything"))
+
+
+class TestReadLastLines(unittest.TestCase):
+    """Test reading the tail of the operations log"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.log_path = Path(self.test_dir) / "operations.jsonl"
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            for i in range(100):
+                f.write(f'{{"id": {i}}}\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_returns_last_lines_in_order(self):
+        """Should return the newest lines, oldest first"""
+        lines = read_last_lines(self.log_path, 3)
+        self.assertEqual(lines, ['{"id": 97}', '{"id": 98}', '{"id": 99}'])
+
+    def test_small_blocks_and_short_files(self):
+        """Should stitch lines split across blocks and cap at file length"""
+        self.assertEqual(read_last_lines(self.log_path, 2, block_size=7), ['{"id": 98}', '{"id": 99}'])
+        self.assertEqual(len(read_last_lines(self.log_path, 500)), 100)
+
+
+class TestRecentOperations(unittest.TestCase):
+    """Test OperationLogger.get_recent_operations"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        log_path = Path(self.test_dir) / "operations.jsonl"
+        patcher = mock.patch('file_organizer.DATA_DIR.operations_file', log_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.logger = OperationLogger()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def log_operation(self, op_type):
+        self.logger.start_operation(op_type, [self.test_dir], self.test_dir)
+        self.logger.end_operation()
+
+    def test_no_log_file(self):
+        """Should return an empty list before anything is logged"""
+        self.assertEqual(self.logger.get_recent_operations(5), [])
+
+    def test_sees_new_operations_after_caching(self):
+        """Should refresh once the log file changes"""
+        self.log_operation("First")
+        self.assertEqual([op["type"] for op in self.logger.get_recent_operations(5)], ["First"])
+        self.log_operation("Second")
+        self.assertEqual([op["type"] for op in self.logger.get_recent_operations(5)], ["First", "Second"])
+        self.assertEqual([op["type"] for op in self.logger.get_recent_operations(1)], ["Second"])
+
+
+class TestStatisticsReport(unittest.TestCase):
+    """Test the statistics window report"""
+
+    @staticmethod
+    def make_op(timestamp, op_type, moved, dupes=0, errors=0, size_mb=0.0):
+        return {"timestamp": timestamp, "type": op_type,
+                "stats": {"files_moved": moved, "duplicates_found": dupes,
+                          "errors": errors, "total_size_mb": size_mb}}
+
+    def test_sections_split_totals_from_recent(self):
+        """Should return the overall totals and recent list as separate sections"""
+        operations = [self.make_op("2025-01-01T10:00:00.000", "Extension", 5)]
+        sections = build_statistics_sections(operations)
+        self.assertEqual([heading for heading, _ in sections],
+                         ["📊 OVERALL STATISTICS", "📈 RECENT OPERATIONS (Last 10)"])
+        self.assertIn("Total Files Organized:   5", sections[0][1])
+        self.assertEqual(sections[1][1], "2025-01-01T10:00:00 | Extension\n  Files: 5 | Dupes: 0 | Errors: 0")
+
+
 class TestUtilityFunctions(unittest.TestCase):
     """Test utility helper functions"""
 
@@ -8,18 +8,21 @@ import sys
 import os
 import tempfile
 import shutil
+from functools import lru_cache
+from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Put src/ on the path and mock tkinter before importing (see _harness.py)
+import _harness  # noqa: F401
 
-# Mock tkinter before importing
-import unittest.mock as mock
-sys.modules['tkinter'] = mock.MagicMock()
-sys.modules['tkinter.ttk'] = mock.MagicMock()
-sys.modules['tkinter.filedialog'] = mock.MagicMock()
-sys.modules['tkinter.messagebox'] = mock.MagicMock()
-sys.modules['tkinter.simpledialog'] = mock.MagicMock()
-sys.modules['tkinterdnd2'] = mock.MagicMock()
+
+@lru_cache(maxsize=None)
+def _load(name):
+    """Return file_organizer.<name>, or None if it (or the module) is missing"""
+    try:
+        import file_organizer
+    except ImportError:
+        return None
+    return getattr(file_organizer, name, None)
 
 
 class TestParseHierarchy(unittest.TestCase):
@@ -27,38 +30,34 @@ class TestParseHierarchy(unittest.TestCase):
 
     def test_parse_hierarchy_function_exists(self):
         """Should have parse_folder_hierarchy function"""
-        try:
-            from file_organizer import parse_folder_hierarchy
-            self.assertTrue(callable(parse_folder_hierarchy))
-        except ImportError:
+        parse_folder_hierarchy = _load("parse_folder_hierarchy")
+        if parse_folder_hierarchy is None:
             self.skipTest("parse_folder_hierarchy not yet implemented")
+        self.assertTrue(callable(parse_folder_hierarchy))
 
     def test_parse_single_level(self):
         """Should parse single-level hierarchy"""
-        try:
-            from file_organizer import parse_folder_hierarchy
-            result = parse_folder_hierarchy("TMC")
-            self.assertEqual(result, ["TMC"])
-        except ImportError:
+        parse_folder_hierarchy = _load("parse_folder_hierarchy")
+        if parse_folder_hierarchy is None:
             self.skipTest("parse_folder_hierarchy not yet implemented")
+        result = parse_folder_hierarchy("TMC")
+        self.assertEqual(result, ["TMC"])
 
     def test_parse_multi_level(self):
         """Should parse multi-level hierarchy with dash delimiter"""
-        try:
-            from file_organizer import parse_folder_hierarchy
-            result = parse_folder_hierarchy("TMC-Aileron-LH")
-            self.assertEqual(result, ["TMC", "Aileron", "LH"])
-        except ImportError:
+        parse_folder_hierarchy = _load("parse_folder_hierarchy")
+        if parse_folder_hierarchy is None:
             self.skipTest("parse_folder_hierarchy not yet implemented")
+        result = parse_folder_hierarchy("TMC-Aileron-LH")
+        self.assertEqual(result, ["TMC", "Aileron", "LH"])
 
     def test_parse_with_spaces(self):
         """Should handle spaces in folder names"""
-        try:
-            from file_organizer import parse_folder_hierarchy
-            result = parse_folder_hierarchy("My Project-Sub Folder-Final")
-            self.assertEqual(result, ["My Project", "Sub Folder", "Final"])
-        except ImportError:
+        parse_folder_hierarchy = _load("parse_folder_hierarchy")
+        if parse_folder_hierarchy is None:
             self.skipTest("parse_folder_hierarchy not yet implemented")
+        result = parse_folder_hierarchy("My Project-Sub Folder-Final")
+        self.assertEqual(result, ["My Project", "Sub Folder", "Final"])
 
 
 class TestNumberedFolderGeneration(unittest.TestCase):
@@ -66,138 +65,126 @@ class TestNumberedFolderGeneration(unittest.TestCase):
 
     def test_generate_numbered_folders_function_exists(self):
         """Should have generate_numbered_folder_names function"""
-        try:
-            from file_organizer import generate_numbered_folder_names
-            self.assertTrue(callable(generate_numbered_folder_names))
-        except ImportError:
+        generate_numbered_folder_names = _load("generate_numbered_folder_names")
+        if generate_numbered_folder_names is None:
             self.skipTest("generate_numbered_folder_names not yet implemented")
+        self.assertTrue(callable(generate_numbered_folder_names))
 
     def test_generate_numbered_folders_single_digit(self):
         """Should generate numbered folders with proper padding for single digits"""
-        try:
-            from file_organizer import generate_numbered_folder_names
-            result = generate_numbered_folder_names(5)
-            self.assertEqual(result, ["001", "002", "003", "004", "005"])
-        except ImportError:
+        generate_numbered_folder_names = _load("generate_numbered_folder_names")
+        if generate_numbered_folder_names is None:
             self.skipTest("generate_numbered_folder_names not yet implemented")
+        result = generate_numbered_folder_names(5)
+        self.assertEqual(result, ["001", "002", "003", "004", "005"])
 
     def test_generate_numbered_folders_double_digit(self):
         """Should generate numbered folders for double digits"""
-        try:
-            from file_organizer import generate_numbered_folder_names
-            result = generate_numbered_folder_names(12)
-            self.assertEqual(len(result), 12)
-            self.assertEqual(result[0], "001")
-            self.assertEqual(result[11], "012")
-        except ImportError:
+        generate_numbered_folder_names = _load("generate_numbered_folder_names")
+        if generate_numbered_folder_names is None:
             self.skipTest("generate_numbered_folder_names not yet implemented")
+        result = generate_numbered_folder_names(12)
+        self.assertEqual(len(result), 12)
+        self.assertEqual(result[0], "001")
+        self.assertEqual(result[11], "012")
 
     def test_generate_numbered_folders_triple_digit(self):
         """Should generate numbered folders for triple digits"""
-        try:
-            from file_organizer import generate_numbered_folder_names
-            result = generate_numbered_folder_names(100)
-            self.assertEqual(len(result), 100)
-            self.assertEqual(result[0], "001")
-            self.assertEqual(result[99], "100")
-        except ImportError:
+        generate_numbered_folder_names = _load("generate_numbered_folder_names")
+        if generate_numbered_folder_names is None:
             self.skipTest("generate_numbered_folder_names not yet implemented")
+        result = generate_numbered_folder_names(100)
+        self.assertEqual(len(result), 100)
+        self.assertEqual(result[0], "001")
+        self.assertEqual(result[99], "100")
 
     def test_generate_zero_folders(self):
         """Should handle zero folders gracefully"""
-        try:
-            from file_organizer import generate_numbered_folder_names
-            result = generate_numbered_folder_names(0)
-            self.assertEqual(result, [])
-        except ImportError:
+        generate_numbered_folder_names = _load("generate_numbered_folder_names")
+        if generate_numbered_folder_names is None:
             self.skipTest("generate_numbered_folder_names not yet implemented")
+        result = generate_numbered_folder_names(0)
+        self.assertEqual(result, [])
 
 
 class TestHierarchyCreation(unittest.TestCase):
     """Test actual folder hierarchy creation"""
 
-    def setUp(self):
-        """Create temp directory for tests"""
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one temp root for the class; each test gets its own subdir"""
+        cls._root = tempfile.mkdtemp()
+        cls._n = 0
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up every test's folders in one pass"""
+        shutil.rmtree(cls._root, ignore_errors=True)
 
-    def tearDown(self):
-        """Clean up"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    def setUp(self):
+        """Create a fresh directory for this test"""
+        type(self)._n += 1
+        self.test_dir = os.path.join(self._root, f"t{self._n}")
+        os.mkdir(self.test_dir)
 
     def test_create_hierarchy_function_exists(self):
         """Should have create_custom_hierarchy function"""
-        try:
-            from file_organizer import create_custom_hierarchy
-            self.assertTrue(callable(create_custom_hierarchy))
-        except ImportError:
+        create_custom_hierarchy = _load("create_custom_hierarchy")
+        if create_custom_hierarchy is None:
             self.skipTest("create_custom_hierarchy not yet implemented")
+        self.assertTrue(callable(create_custom_hierarchy))
 
     def test_create_single_level_hierarchy(self):
         """Should create single-level folder"""
-        try:
-            from file_organizer import create_custom_hierarchy
-            create_custom_hierarchy(self.test_dir, "TestFolder", 0)
-
-            expected_path = os.path.join(self.test_dir, "TestFolder")
-            self.assertTrue(os.path.exists(expected_path))
-            self.assertTrue(os.path.isdir(expected_path))
-        except ImportError:
+        create_custom_hierarchy = _load("create_custom_hierarchy")
+        if create_custom_hierarchy is None:
             self.skipTest("create_custom_hierarchy not yet implemented")
+        create_custom_hierarchy(self.test_dir, "TestFolder", 0)
+
+        # is_dir() is False for a missing path, so it covers existence too
+        self.assertTrue(Path(self.test_dir, "TestFolder").is_dir())
 
     def test_create_nested_hierarchy(self):
         """Should create nested folder structure"""
-        try:
-            from file_organizer import create_custom_hierarchy
-            create_custom_hierarchy(self.test_dir, "TMC-Aileron-LH", 0)
-
-            # Check all levels exist
-            level1 = os.path.join(self.test_dir, "TMC")
-            level2 = os.path.join(level1, "Aileron")
-            level3 = os.path.join(level2, "LH")
-
-            self.assertTrue(os.path.exists(level1))
-            self.assertTrue(os.path.exists(level2))
-            self.assertTrue(os.path.exists(level3))
-        except ImportError:
+        create_custom_hierarchy = _load("create_custom_hierarchy")
+        if create_custom_hierarchy is None:
             self.skipTest("create_custom_hierarchy not yet implemented")
+        create_custom_hierarchy(self.test_dir, "TMC-Aileron-LH", 0)
+
+        # The deepest level can only exist if every level above it does
+        self.assertTrue(Path(self.test_dir, "TMC", "Aileron", "LH").is_dir())
 
     def test_create_numbered_subfolders(self):
         """Should create numbered subfolders in final level"""
-        try:
-            from file_organizer import create_custom_hierarchy
-            create_custom_hierarchy(self.test_dir, "TMC-Aileron-LH", 5)
-
-            # Check numbered folders exist
-            lh_path = os.path.join(self.test_dir, "TMC", "Aileron", "LH")
-
-            for i in range(1, 6):
-                numbered_folder = os.path.join(lh_path, f"{i:03d}")
-                self.assertTrue(os.path.exists(numbered_folder),
-                              f"Folder {numbered_folder} should exist")
-        except ImportError:
+        create_custom_hierarchy = _load("create_custom_hierarchy")
+        if create_custom_hierarchy is None:
             self.skipTest("create_custom_hierarchy not yet implemented")
+        create_custom_hierarchy(self.test_dir, "TMC-Aileron-LH", 5)
+
+        # Check numbered folders exist (one directory listing, no per-folder stat)
+        lh_path = os.path.join(self.test_dir, "TMC", "Aileron", "LH")
+        entries = set(os.listdir(lh_path))
+
+        for i in range(1, 6):
+            self.assertIn(f"{i:03d}", entries,
+                          f"Folder {os.path.join(lh_path, f'{i:03d}')} should exist")
 
     def test_create_50_numbered_folders(self):
         """Should create 50 numbered folders as per user example"""
-        try:
-            from file_organizer import create_custom_hierarchy
-            create_custom_hierarchy(self.test_dir, "TMC-Aileron-LH", 50)
-
-            lh_path = os.path.join(self.test_dir, "TMC", "Aileron", "LH")
+        create_custom_hierarchy = _load("create_custom_hierarchy")
+        if create_custom_hierarchy is None:
+            self.skipTest("create_custom_hierarchy not yet implemented")
+        create_custom_hierarchy(self.test_dir, "TMC-Aileron-LH", 50)
 
-            # Check first and last folder
-            first_folder = os.path.join(lh_path, "001")
-            last_folder = os.path.join(lh_path, "050")
+        lh_path = os.path.join(self.test_dir, "TMC", "Aileron", "LH")
+        folders = set(os.listdir(lh_path))
 
-            self.assertTrue(os.path.exists(first_folder))
-            self.assertTrue(os.path.exists(last_folder))
+        # Check first and last folder
+        self.assertIn("001", folders)
+        self.assertIn("050", folders)
 
-            # Count total folders
-            folders = os.listdir(lh_path)
-            self.assertEqual(len(folders), 50)
-        except ImportError:
-            self.skipTest("create_custom_hierarchy not yet implemented")
+        # Count total folders
+        self.assertEqual(len(folders), 50)
 
 
 def run_tests():
@@ -11,17 +11,8 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-# Mock tkinter before importing
-import unittest.mock as mock
-sys.modules['tkinter'] = mock.MagicMock()
-sys.modules['tkinter.ttk'] = mock.MagicMock()
-sys.modules['tkinter.filedialog'] = mock.MagicMock()
-sys.modules['tkinter.messagebox'] = mock.MagicMock()
-sys.modules['tkinter.simpledialog'] = mock.MagicMock()
-sys.modules['tkinterdnd2'] = mock.MagicMock()
+# Put src/ on the path and mock tkinter before importing (see _harness.py)
+import _harness  # noqa: F401
 
 # Now import from file_organizer
 from file_organizer import get_file_datetime
@@ -6,40 +6,96 @@ Tests pattern detection, gap finding, and placeholder file creation.
 
 import unittest
 import os
-import sys
+import copy
 import tempfile
 import shutil
 from pathlib import Path
 
-# Add parent directory to path to import file_organizer
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Put src/ on the path and mock tkinter before importing (see _harness.py)
+import _harness  # noqa: F401
 
 from file_organizer import (
     detect_file_patterns,
     find_missing_files,
     create_placeholder_files,
-    log_missing_files_operation
+    log_missing_files_operation,
+    detect_file_patterns_recursive,
+    create_placeholders_for_folder
 )
 
 
-class TestMissingFileScanner(unittest.TestCase):
-    """Test suite for missing file scanner functionality"""
+def only_pattern(patterns):
+    """Return the value of a single-pattern result without building a list"""
+    return next(iter(patterns.values()))
 
-    def setUp(self):
-        """Create temporary test directory"""
-        self.test_dir = tempfile.mkdtemp()
 
-    def tearDown(self):
-        """Clean up temporary test directory"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+def find_ramdisk():
+    """Return a writable tmpfs mount (/dev/shm or /tmp), or None"""
+    try:
+        with open('/proc/mounts', 'r') as f:
+            tmpfs_mounts = {line.split()[1] for line in f if line.split()[2:3] == ['tmpfs']}
+    except OSError:
+        return None  # Not Linux; tempfile already honours $TMPDIR
+    for candidate in ('/dev/shm', '/tmp'):
+        if candidate in tmpfs_mounts and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+
+class MissingFileTestCase(unittest.TestCase):
+    """Shared temp-root selection and file helpers for the scanner tests"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Pick the temp root (RAM-backed when FILE_ORG_TESTS_RAMDISK=1)"""
+        cls._tmproot = None
+        if os.environ.get('FILE_ORG_TESTS_RAMDISK') == '1':
+            cls._tmproot = find_ramdisk()
 
-    def create_test_files(self, filenames):
+    def make_temp_dir(self):
+        """Helper: Create a temporary directory under the chosen temp root"""
+        # Per-process prefix keeps parallel (pytest-xdist) workers' dirs apart
+        return tempfile.mkdtemp(prefix=f'fo_{os.getpid()}_', dir=self._tmproot)
+
+    def create_test_files(self, filenames, directory=None):
         """Helper: Create empty test files"""
+        # Raw os.open/os.close: no buffered file object per empty file
+        prefix = os.path.join(directory or self.test_dir, '')
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
         for filename in filenames:
-            filepath = os.path.join(self.test_dir, filename)
-            with open(filepath, 'w') as f:
-                pass
+            os.close(os.open(prefix + filename, flags, 0o644))
+
+
+class TestMissingFileScannerReadOnly(MissingFileTestCase):
+    """Pattern and gap detection tests that never write to their directory"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start with no shared fixtures"""
+        super().setUpClass()
+        cls._fixture_cache = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared read-only fixture directories"""
+        for fixture_dir, _ in cls._fixture_cache.values():
+            shutil.rmtree(fixture_dir, ignore_errors=True)
+
+    def get_fixture(self, filenames):
+        """
+        Helper: Return (directory, patterns) for a read-only set of files.
+
+        Identical file sets share one directory and one scan per class. The
+        patterns are copied so tests cannot leak changes into each other.
+        """
+        key = frozenset(filenames)
+        cached = self._fixture_cache.get(key)
+        if cached is None:
+            fixture_dir = self.make_temp_dir()
+            self.create_test_files(filenames, fixture_dir)
+            cached = self._fixture_cache[key] = (fixture_dir, detect_file_patterns(fixture_dir))
+        return cached[0], copy.deepcopy(cached[1])
+
 
     # ═══════════════════════════════════════════════════════════════════════
     # ── PATTERN DETECTION TESTS ───────────────────────────────────────────
@@ -47,12 +103,10 @@ class TestMissingFileScanner(unittest.TestCase):
 
     def test_pure_numeric_pattern_detection(self):
         """Test detection of pure numeric files (001.jpg, 002.jpg)"""
-        self.create_test_files(['001.jpg', '002.jpg', '005.jpg', '010.jpg'])
-
-        patterns = detect_file_patterns(self.test_dir)
+        _, patterns = self.get_fixture(['001.jpg', '002.jpg', '005.jpg', '010.jpg'])
 
         self.assertEqual(len(patterns), 1)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
 
         self.assertTrue(pattern_data['is_pure_numeric'])
         self.assertEqual(pattern_data['padding'], 3)
@@ -61,12 +115,10 @@ class TestMissingFileScanner(unittest.TestCase):
 
     def test_prefixed_pattern_detection(self):
         """Test detection of prefixed files (IMG_001.jpg, IMG_003.jpg)"""
-        self.create_test_files(['IMG_001.jpg', 'IMG_003.jpg', 'IMG_007.jpg'])
-
-        patterns = detect_file_patterns(self.test_dir)
+        _, patterns = self.get_fixture(['IMG_001.jpg', 'IMG_003.jpg', 'IMG_007.jpg'])
 
         self.assertEqual(len(patterns), 1)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
 
         self.assertFalse(pattern_data['is_pure_numeric'])
         self.assertEqual(pattern_data['prefix'], 'IMG_')
@@ -76,24 +128,20 @@ class TestMissingFileScanner(unittest.TestCase):
 
     def test_multiple_patterns_in_same_folder(self):
         """Test detection when multiple patterns exist"""
-        self.create_test_files([
+        _, patterns = self.get_fixture([
             'IMG_001.jpg', 'IMG_003.jpg',
             'SCAN_010.pdf', 'SCAN_015.pdf',
             '001.png', '005.png'
         ])
 
-        patterns = detect_file_patterns(self.test_dir)
-
         self.assertEqual(len(patterns), 3)  # IMG, SCAN, and pure numeric
 
     def test_no_padding_pattern(self):
         """Test files without zero-padding (file_1.jpg, file_20.jpg)"""
-        self.create_test_files(['file_1.jpg', 'file_2.jpg', 'file_20.jpg'])
-
-        patterns = detect_file_patterns(self.test_dir)
+        _, patterns = self.get_fixture(['file_1.jpg', 'file_2.jpg', 'file_20.jpg'])
 
         self.assertEqual(len(patterns), 1)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
 
         self.assertEqual(pattern_data['prefix'], 'file_')
         # Padding should be 2 (from "20")
@@ -101,16 +149,14 @@ class TestMissingFileScanner(unittest.TestCase):
 
     def test_pattern_with_suffix(self):
         """Test files with prefix + number + suffix (IMG_001_final.jpg)"""
-        self.create_test_files([
+        _, patterns = self.get_fixture([
             'IMG_001_final.jpg',
             'IMG_003_final.jpg',
             'IMG_005_final.jpg'
         ])
 
-        patterns = detect_file_patterns(self.test_dir)
-
         self.assertEqual(len(patterns), 1)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
 
         self.assertEqual(pattern_data['prefix'], 'IMG_')
         self.assertEqual(pattern_data['suffix'], '_final')
@@ -118,17 +164,13 @@ class TestMissingFileScanner(unittest.TestCase):
 
     def test_minimum_files_requirement(self):
         """Test that patterns need at least 2 files"""
-        self.create_test_files(['001.jpg'])  # Only 1 file
-
-        patterns = detect_file_patterns(self.test_dir)
+        _, patterns = self.get_fixture(['001.jpg'])  # Only 1 file
 
         self.assertEqual(len(patterns), 0)  # Should be empty
 
     def test_mixed_extensions_separate_patterns(self):
         """Test that different extensions create separate patterns"""
-        self.create_test_files(['001.jpg', '002.jpg', '001.pdf', '002.pdf'])
-
-        patterns = detect_file_patterns(self.test_dir)
+        _, patterns = self.get_fixture(['001.jpg', '002.jpg', '001.pdf', '002.pdf'])
 
         # Should detect 2 patterns: .jpg and .pdf
         self.assertEqual(len(patterns), 2)
@@ -139,63 +181,107 @@ class TestMissingFileScanner(unittest.TestCase):
 
     def test_pure_numeric_starts_from_1(self):
         """Test that pure numeric files assume sequence starts at 1"""
-        self.create_test_files(['010.jpg', '015.jpg', '020.jpg'])
+        _, patterns = self.get_fixture(['010.jpg', '015.jpg', '020.jpg'])
 
-        patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
-        # Should find 1-9, 11-14, 16-19
-        self.assertIn(1, missing)
-        self.assertIn(9, missing)
-        self.assertIn(11, missing)
-        self.assertIn(19, missing)
-        self.assertEqual(len(missing), 9 + 4 + 4)  # 17 missing files
+        # Should find 1-9, 11-14, 16-19 (17 missing files)
+        expected = set(range(1, 20)) - {10, 15}
+        self.assertEqual(set(missing), expected)
+        self.assertEqual(len(missing), len(expected))
 
     def test_prefixed_fills_gaps_only(self):
         """Test that prefixed files only fill gaps between existing"""
-        self.create_test_files(['IMG_010.jpg', 'IMG_015.jpg', 'IMG_020.jpg'])
+        _, patterns = self.get_fixture(['IMG_010.jpg', 'IMG_015.jpg', 'IMG_020.jpg'])
 
-        patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
-        # Should NOT include 1-9, only 11-14 and 16-19
-        self.assertNotIn(1, missing)
-        self.assertNotIn(9, missing)
-        self.assertIn(11, missing)
-        self.assertIn(19, missing)
-        self.assertEqual(len(missing), 4 + 4)  # 8 missing files
+        # Should NOT include 1-9, only 11-14 and 16-19 (8 missing files)
+        expected = set(range(11, 20)) - {15}
+        self.assertEqual(set(missing), expected)
+        self.assertEqual(len(missing), len(expected))
 
     def test_find_missing_simple_gap(self):
         """Test finding simple gaps (1,2,5 -> missing 3,4)"""
-        self.create_test_files(['001.jpg', '002.jpg', '005.jpg'])
+        _, patterns = self.get_fixture(['001.jpg', '002.jpg', '005.jpg'])
 
-        patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
         self.assertEqual(missing, [3, 4])
 
     def test_no_missing_files(self):
         """Test when sequence is complete (no gaps)"""
-        self.create_test_files(['001.jpg', '002.jpg', '003.jpg', '004.jpg'])
+        _, patterns = self.get_fixture(['001.jpg', '002.jpg', '003.jpg', '004.jpg'])
 
-        patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
         self.assertEqual(missing, [])
 
     def test_large_gap(self):
         """Test detection of large gaps"""
-        self.create_test_files(['001.jpg', '100.jpg'])
+        _, patterns = self.get_fixture(['001.jpg', '100.jpg'])
 
-        patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
+        missing = find_missing_files(pattern_data)
+
+        self.assertEqual(set(missing), set(range(2, 100)))  # 2-99
+        self.assertEqual(len(missing), 98)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # ── EDGE CASES ────────────────────────────────────────────────────────
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def test_empty_directory(self):
+        """Test scanner on empty directory"""
+        _, patterns = self.get_fixture([])
+        self.assertEqual(len(patterns), 0)
+
+    def test_no_numeric_files(self):
+        """Test directory with no numeric patterns"""
+        _, patterns = self.get_fixture(['photo.jpg', 'image.png', 'document.pdf'])
+
+        self.assertEqual(len(patterns), 0)
+
+    def test_invalid_directory(self):
+        """Test with non-existent directory"""
+        patterns = detect_file_patterns('/nonexistent/path')
+        self.assertEqual(len(patterns), 0)
+
+    def test_sequence_starting_at_1(self):
+        """Test pure numeric starting at 1 (no gaps before)"""
+        _, patterns = self.get_fixture(['001.jpg', '002.jpg', '005.jpg'])
+
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
-        self.assertEqual(len(missing), 98)  # 2-99
+        # Should only find 3, 4 (not before 1)
+        self.assertEqual(missing, [3, 4])
+
+
+class TestMissingFileScanner(MissingFileTestCase):
+    """Placeholder creation and logging tests, each on a fresh directory"""
+
+    def setUp(self):
+        """Create temporary test directory"""
+        self.test_dir = self.make_temp_dir()
+
+    def tearDown(self):
+        """Clean up temporary test directory"""
+        # Fixtures are flat, so unlink entries directly; anything else
+        # (e.g. a subdirectory) falls back to rmtree
+        try:
+            with os.scandir(self.test_dir) as it:
+                for entry in it:
+                    os.unlink(entry.path)
+            os.rmdir(self.test_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            shutil.rmtree(self.test_dir, ignore_errors=True)
 
     # ═══════════════════════════════════════════════════════════════════════
     # ── PLACEHOLDER CREATION TESTS ────────────────────────────────────────
@@ -206,7 +292,7 @@ class TestMissingFileScanner(unittest.TestCase):
         self.create_test_files(['001.jpg', '005.jpg'])
 
         patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
         success, msg, created = create_placeholder_files(
@@ -226,7 +312,7 @@ class TestMissingFileScanner(unittest.TestCase):
         self.create_test_files(['001.jpg', '010.jpg'])
 
         patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
         success, msg, created = create_placeholder_files(
@@ -238,12 +324,25 @@ class TestMissingFileScanner(unittest.TestCase):
         self.assertIn('009.jpg', created)
         self.assertTrue(os.path.exists(os.path.join(self.test_dir, '002.jpg')))
 
+    @unittest.skipUnless(os.name == 'posix', "umask applies to POSIX permissions")
+    def test_placeholder_permissions_follow_umask(self):
+        """Test that placeholders get the umask's permissions, like open()"""
+        self.create_test_files(['001.jpg', '003.jpg'])
+        old_umask = os.umask(0o002)
+        self.addCleanup(os.umask, old_umask)
+
+        pattern_data = only_pattern(detect_file_patterns(self.test_dir))
+        create_placeholder_files(self.test_dir, pattern_data, find_missing_files(pattern_data))
+
+        mode = os.stat(os.path.join(self.test_dir, '002.jpg')).st_mode & 0o777
+        self.assertEqual(mode, 0o664)
+
     def test_placeholder_with_prefix(self):
         """Test placeholder creation with prefix"""
         self.create_test_files(['IMG_001.jpg', 'IMG_005.jpg'])
 
         patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
         success, msg, created = create_placeholder_files(
@@ -260,7 +359,7 @@ class TestMissingFileScanner(unittest.TestCase):
         self.create_test_files(['IMG_001_final.jpg', 'IMG_003_final.jpg'])
 
         patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
         success, msg, created = create_placeholder_files(
@@ -275,7 +374,7 @@ class TestMissingFileScanner(unittest.TestCase):
         self.create_test_files(['001.jpg', '003.jpg'])
 
         patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
 
         create_placeholder_files(self.test_dir, pattern_data, missing)
@@ -283,6 +382,24 @@ class TestMissingFileScanner(unittest.TestCase):
         placeholder_path = os.path.join(self.test_dir, '002.jpg')
         self.assertEqual(os.path.getsize(placeholder_path), 0)
 
+    def test_recursive_scan_reuses_missing_lists(self):
+        """Test that placeholders are created from the gap lists found by the recursive scan"""
+        sub_dir = os.path.join(self.test_dir, 'album')
+        os.mkdir(sub_dir)
+        self.create_test_files(['001.jpg', '004.jpg'], sub_dir)
+
+        results = detect_file_patterns_recursive(self.test_dir)
+        folder = results[sub_dir]
+        self.assertEqual(folder['missing'], {'PURE_NUMERIC_.jpg': [2, 3]})
+
+        created, failed, errors = create_placeholders_for_folder(
+            sub_dir, folder['patterns'], folder['missing']
+        )
+
+        self.assertEqual((created, failed, errors), (2, 0, []))
+        self.assertTrue(os.path.exists(os.path.join(sub_dir, '002.jpg')))
+        self.assertTrue(os.path.exists(os.path.join(sub_dir, '003.jpg')))
+
     # ═══════════════════════════════════════════════════════════════════════
     # ── LOGGING TESTS ─────────────────────────────────────────────────────
     # ═══════════════════════════════════════════════════════════════════════
@@ -292,8 +409,8 @@ class TestMissingFileScanner(unittest.TestCase):
         self.create_test_files(['001.jpg', '003.jpg'])
 
         patterns = detect_file_patterns(self.test_dir)
-        pattern_key = list(patterns.keys())[0]
-        pattern_data = list(patterns.values())[0]
+        pattern_key = next(iter(patterns))
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
         success, msg, created = create_placeholder_files(
             self.test_dir, pattern_data, missing
@@ -314,8 +431,8 @@ class TestMissingFileScanner(unittest.TestCase):
         self.create_test_files(['001.jpg', '005.jpg'])
 
         patterns = detect_file_patterns(self.test_dir)
-        pattern_key = list(patterns.keys())[0]
-        pattern_data = list(patterns.values())[0]
+        pattern_key = next(iter(patterns))
+        pattern_data = only_pattern(patterns)
         missing = find_missing_files(pattern_data)
         success, msg, created = create_placeholder_files(
             self.test_dir, pattern_data, missing
@@ -330,48 +447,16 @@ class TestMissingFileScanner(unittest.TestCase):
             parent_dir, '.file_organizer_data', 'missing_files.log'
         )
 
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
+        # The markers are ASCII, so match on the raw bytes without decoding
+        log_content = Path(log_path).read_bytes()
 
-        self.assertIn('Parent Directory:', log_content)
-        self.assertIn('Folder:', log_content)
-        self.assertIn('Missing Files:', log_content)
-        self.assertIn('002.jpg', log_content)
-        self.assertIn('003.jpg', log_content)
-        self.assertIn('004.jpg', log_content)
-        self.assertIn('Total:', log_content)
-
-    # ═══════════════════════════════════════════════════════════════════════
-    # ── EDGE CASES ────────────────────────────────────────────────────────
-    # ═══════════════════════════════════════════════════════════════════════
-
-    def test_empty_directory(self):
-        """Test scanner on empty directory"""
-        patterns = detect_file_patterns(self.test_dir)
-        self.assertEqual(len(patterns), 0)
-
-    def test_no_numeric_files(self):
-        """Test directory with no numeric patterns"""
-        self.create_test_files(['photo.jpg', 'image.png', 'document.pdf'])
-
-        patterns = detect_file_patterns(self.test_dir)
-        self.assertEqual(len(patterns), 0)
-
-    def test_invalid_directory(self):
-        """Test with non-existent directory"""
-        patterns = detect_file_patterns('/nonexistent/path')
-        self.assertEqual(len(patterns), 0)
-
-    def test_sequence_starting_at_1(self):
-        """Test pure numeric starting at 1 (no gaps before)"""
-        self.create_test_files(['001.jpg', '002.jpg', '005.jpg'])
-
-        patterns = detect_file_patterns(self.test_dir)
-        pattern_data = list(patterns.values())[0]
-        missing = find_missing_files(pattern_data)
-
-        # Should only find 3, 4 (not before 1)
-        self.assertEqual(missing, [3, 4])
+        self.assertIn(b'Parent Directory:', log_content)
+        self.assertIn(b'Folder:', log_content)
+        self.assertIn(b'Missing Files:', log_content)
+        self.assertIn(b'002.jpg', log_content)
+        self.assertIn(b'003.jpg', log_content)
+        self.assertIn(b'004.jpg', log_content)
+        self.assertIn(b'Total:', log_content)
 
 
 if __name__ == '__main__':